@@ -1,16 +1,51 @@
-from fastapi import APIRouter
-from api.v1.endpoints import test, auth, user, language
+from fastapi import APIRouter, Depends
+from api.v1.dependencies.concurrency import bulkhead
+from api.v1.dependencies.rate_limit import rate_limit_ip
+from api.v1.endpoints import test, auth, user, language, batch, word, vocabulary, sync, job, quiz, profiler
+from db.session import release_sessions
 
-api_router = APIRouter()
+# Yavaş istemciye yanıt gönderilirken DB bağlantısı tutulmasın
+api_router = APIRouter(dependencies=[Depends(release_sessions, scope="function")])
+
+# Eşzamanlılık bulkhead'leri: yoğun bir grup diğerlerinin threadpool ve DB pool payını tüketmesin
+# Rate limit'e takılacak istekler auth slotu ve kuyruk yeri tutmasın diye önce IP limiti çalışır
+auth_traffic = [Depends(rate_limit_ip), Depends(bulkhead("auth"))]
+read_traffic = [Depends(bulkhead("read"))]
+write_traffic = [Depends(bulkhead("write"))]
+admin_traffic = [Depends(bulkhead("admin"))]
 
 # Test endpoints
-api_router.include_router(test.router, prefix="/test", tags=["test"])
+api_router.include_router(test.router, prefix="/test", tags=["test"], dependencies=admin_traffic)
 
 # Auth endpoints
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
+api_router.include_router(auth.router, prefix="/auth", tags=["authentication"], dependencies=auth_traffic)
 
 # User endpoints
-api_router.include_router(user.router, prefix="/user", tags=["user"])
+api_router.include_router(user.router, prefix="/user", tags=["user"], dependencies=read_traffic)
 
 # Language endpoints
-api_router.include_router(language.router, prefix="/language", tags=["language"])
\ No newline at end of file
+api_router.include_router(language.router, prefix="/language", tags=["language"], dependencies=read_traffic)
+
+# Word endpoints
+api_router.include_router(word.router, prefix="/word", tags=["word"], dependencies=read_traffic)
+
+# Vocabulary pack endpoints
+api_router.include_router(vocabulary.router, prefix="/vocabulary", tags=["vocabulary"], dependencies=read_traffic)
+
+# Offline sync endpoints
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"], dependencies=write_traffic)
+
+# Quiz endpoints
+api_router.include_router(quiz.router, prefix="/quiz", tags=["quiz"])
+
+# Job admin endpoints
+api_router.include_router(job.router, prefix="/job", tags=["job"], dependencies=admin_traffic)
+
+# Profiler endpoints
+api_router.include_router(profiler.router, prefix="/profiler", tags=["profiler"], dependencies=admin_traffic)
+
+# Batch endpoints
+# Alt istekler ayrıca kendi route'larının bulkhead'inden slot alır; batch slotu yalnızca aynı anda
+# açık batch sayısını (ve bellekte tutulan alt yanıtları) sınırlar. Alt istekler sırayla
+# çalıştığından batch başına en fazla bir alt istek slotu tutulur.
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"], dependencies=[Depends(bulkhead("batch"))])
\ No newline at end of file
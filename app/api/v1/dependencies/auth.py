@@ -1,58 +1,100 @@
-from fastapi import Depends, HTTPException, status
+from typing import Callable
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from core.security import verify_token
-from db.session import get_db
+from db.session import get_db, get_read_db, is_user_sticky
 from db.models.user import User, UserRole
 from crud.user import get_user_by_id
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    JWT token'dan mevcut kullanıcıyı getirir
-    """
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _user_id_from_credentials(credentials: HTTPAuthorizationCredentials) -> int:
+    """
+    Access token'ı doğrular ve kullanıcı id'sini döner
+    """
+    payload = verify_token(credentials.credentials)
+    if payload is None or payload.get("type") != "access" or payload.get("sub") is None:
+        raise _credentials_exception()
     try:
-        # Token'ı doğrula
-        payload = verify_token(credentials.credentials)
-        if payload is None:
-            raise credentials_exception
-        
-        # Token tipini kontrol et (access token olmalı)
-        if payload.get("type") != "access":
-            raise credentials_exception
-        
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-            
-    except Exception:
-        raise credentials_exception
-    
-    # Kullanıcıyı veritabanından getir
+        return int(payload["sub"])
+    except (TypeError, ValueError):
+        raise _credentials_exception()
+
+
+def _load_active_user(db: Session, user_id: int) -> User:
+    """
+    Kullanıcıyı getirir, aktif olduğunu kontrol eder ve bağlantıyı havuza iade eder
+    """
     user = get_user_by_id(db, user_id=user_id)
     if user is None:
-        raise credentials_exception
-    
-    # Kullanıcının aktif olup olmadığını kontrol et
+        raise _credentials_exception()
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
+    # Bağlantıyı endpoint'in kendi sorgusuna kadar havuza iade et
+    db.release()
+    return user
+
+def _batch_cached_user(request: Request, token: str, db: Session, load: Callable[[], User]) -> User:
+    """
+    Batch alt isteklerinde kullanıcıyı token ve paylaşılan session başına bir kez çözer
+    """
+    batch = request.scope.get("batch")
+    if batch is None:
+        return load()
+    key = (token, id(db))
+    user = batch["users"].get(key)
+    if user is None:
+        user = batch["users"][key] = load()
     return user
 
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    JWT token'dan mevcut kullanıcıyı getirir
+    """
+    return _batch_cached_user(
+        request, credentials.credentials, db,
+        lambda: _load_active_user(db, _user_id_from_credentials(credentials)),
+    )
+
+def get_current_user_read(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_read_db)
+) -> User:
+    """
+    JWT token'dan mevcut kullanıcıyı read replica üzerinden getirir
+    (kullanıcı yakın zamanda yazma yaptıysa primary kullanılır)
+    """
+    def load() -> User:
+        user_id = _user_id_from_credentials(credentials)
+
+        # Read-your-writes: kendi yazmasından hemen sonra primary'den oku
+        if is_user_sticky(user_id):
+            db.use_primary()
+
+        return _load_active_user(db, user_id)
+
+    return _batch_cached_user(request, credentials.credentials, db, load)
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """
     Mevcut aktif kullanıcıyı getirir
@@ -0,0 +1,55 @@
+import time
+from typing import Callable
+from fastapi import HTTPException, Request, status
+from core.cache import cache_guard
+from core.concurrency import get_limiter
+from core.config import settings
+
+_dependencies = {}
+
+
+def use_bulkhead(name: str) -> Callable:
+    """
+    Endpoint'i router'ın bulkhead'i yerine verilen bulkhead'e bağlar
+    (örn. süresi istemcinin indirme hızına bağlı yanıtlar için "download")
+    """
+    get_limiter(name)
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__bulkhead__ = name
+        return endpoint
+    return decorator
+
+
+def bulkhead(name: str) -> Callable:
+    """
+    Verilen bulkhead'in eşzamanlılık limitini uygulayan dependency'yi döner.
+    Router veya route dependencies listesine eklenir; diğer dependency'lerden önce çözülür.
+    Batch alt istekleri de kendi route'larının bulkhead'inden slot alır.
+    """
+    dependency = _dependencies.get(name)
+    if dependency is not None:
+        return dependency
+
+    get_limiter(name)
+
+    async def dependency(request: Request):
+        if not settings.CONCURRENCY_ENABLED:
+            yield
+            return
+        endpoint = request.scope.get("endpoint")
+        limiter = get_limiter(getattr(endpoint, "__bulkhead__", name))
+        if not await limiter.acquire():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sunucu yoğun, lütfen daha sonra tekrar deneyin",
+                headers={"Retry-After": str(limiter.retry_after())},
+            )
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            limiter.release(time.perf_counter() - started)
+
+    _dependencies[name] = cache_guard(dependency)
+    return dependency
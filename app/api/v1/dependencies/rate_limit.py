@@ -0,0 +1,51 @@
+import math
+from fastapi import HTTPException, Request, status
+from core.cache import cache_guard
+from core.config import settings
+from core.rate_limit import consume
+
+
+def _too_many_requests(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Çok fazla istek, lütfen daha sonra tekrar deneyin",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    İsteği yapan istemcinin IP adresini döner
+    """
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+@cache_guard
+def rate_limit_ip(request: Request):
+    """
+    IP başına istek sınırı uygular (DB ve hash işlemlerinden önce çalışır)
+    """
+    allowed, retry_after = consume(
+        f"ip:{get_client_ip(request)}",
+        settings.RATE_LIMIT_IP_CAPACITY,
+        settings.RATE_LIMIT_IP_REFILL_PER_SECOND,
+    )
+    if not allowed:
+        raise _too_many_requests(retry_after)
+
+
+def rate_limit_email(email: str):
+    """
+    Email başına deneme sınırı uygular
+    """
+    allowed, retry_after = consume(
+        f"email:{email.strip().lower()}",
+        settings.RATE_LIMIT_EMAIL_CAPACITY,
+        settings.RATE_LIMIT_EMAIL_REFILL_PER_SECOND,
+    )
+    if not allowed:
+        raise _too_many_requests(retry_after)
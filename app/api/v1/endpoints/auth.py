@@ -2,13 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
-from db.session import get_db
+from db.session import get_db, mark_user_write
 from core.security import create_access_token, create_refresh_token
 from core.config import settings
-from crud.user import authenticate_user, create_user, update_user_last_login, get_user_by_email
+from crud.user import authenticate_user, create_user, update_user_last_login, get_user_by_email, get_user_by_id
 from schemas.auth import UserRegister, Token, UserResponse, GoogleLogin
-from db.models.user import User
 from core.google_auth import GoogleAuthService
+from api.v1.dependencies.rate_limit import rate_limit_email
 
 router = APIRouter()
 
@@ -17,6 +17,8 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """
     Yeni kullanıcı kaydı
     """
+    rate_limit_email(user_data.email)
+
     # Email zaten var mı kontrol et
     existing_user = get_user_by_email(db, user_data.email)
     if existing_user:
@@ -40,6 +42,9 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     """
     Kullanıcı girişi ve token oluşturma
     """
+    # Email başına deneme sınırı (DB sorgusu ve bcrypt'ten önce)
+    rate_limit_email(form_data.username)
+
     # Kullanıcıyı doğrula
     user = authenticate_user(db, form_data.username, form_data.password)
     if not user:
@@ -58,6 +63,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     
     # Son giriş zamanını güncelle
     update_user_last_login(db, user.id)
+    mark_user_write(user.id)
     
     # Token'ları oluştur
     access_token_expires = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -96,7 +102,7 @@ def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = get_user_by_id(db, user_id=int(user_id))
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
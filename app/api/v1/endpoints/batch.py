@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+from core.config import settings
+from schemas.batch import BatchRequest, BatchResponse, BatchSubRequest, BatchSubResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+API_PREFIX = "/api/v1"
+
+# Alt isteklere aktarılmayan üst istek başlıkları
+_DROPPED_HEADERS = ("content-length", "content-type", "accept-encoding", "transfer-encoding")
+
+
+def _sub_request_path(sub_request: BatchSubRequest) -> tuple:
+    path, _, query = sub_request.path.partition("?")
+    if not path.startswith(API_PREFIX):
+        path = API_PREFIX + (path if path.startswith("/") else "/" + path)
+    return path, query
+
+
+def _build_scope(request: Request, sub_request: BatchSubRequest, path: str, query: str, state: dict) -> dict:
+    headers = {
+        key.lower(): value
+        for key, value in request.headers.items()
+        if key.lower() not in _DROPPED_HEADERS
+    }
+    headers.update({key.lower(): value for key, value in sub_request.headers.items()})
+    if sub_request.body is not None:
+        headers["content-type"] = "application/json"
+
+    return {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method.upper(),
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()],
+        "state": dict(request.scope.get("state") or {}),
+        # Batch başına paylaşılan session'lar ve çözülmüş kullanıcılar (get_db, get_current_user okur)
+        "batch": state,
+    }
+
+
+def _response_body(body: bytes, content_type: str):
+    if not body:
+        return None
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _run_sub_request(request: Request, sub_request: BatchSubRequest, state: dict) -> BatchSubResponse:
+    """
+    Alt isteği uygulamanın kendi ASGI akışından (middleware, route cache, dependency'ler) geçirir
+    """
+    path, query = _sub_request_path(sub_request)
+    if path.rstrip("/") == API_PREFIX + "/batch":
+        return BatchSubResponse(status=status.HTTP_400_BAD_REQUEST, body={"detail": "İç içe batch desteklenmez"})
+
+    scope = _build_scope(request, sub_request, path, query, state)
+    body = b"" if sub_request.body is None else json.dumps(jsonable_encoder(sub_request.body)).encode()
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # İstemci bağlantısı batch isteğine aittir; alt istek bitene kadar bağlı kabul edilir
+        await asyncio.get_running_loop().create_future()
+
+    result = {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "headers": {}}
+    chunks = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["headers"] = {
+                key.decode("latin-1"): value.decode("latin-1")
+                for key, value in message.get("headers", [])
+                if key.lower() != b"content-length"
+            }
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        logger.exception("Batch sub-request failed: %s %s", sub_request.method, sub_request.path)
+        return BatchSubResponse(
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            body={"detail": "Internal Server Error"},
+        )
+
+    return BatchSubResponse(
+        status=result["status"],
+        headers=result["headers"],
+        body=_response_body(b"".join(chunks), result["headers"].get("content-type", "")),
+    )
+
+
+@router.post("", response_model=BatchResponse)
+async def batch(payload: BatchRequest, request: Request):
+    """
+    Birden fazla API çağrısını tek HTTP isteğinde çalıştırır.
+    Her alt istek normal bir istek gibi middleware, cache ve dependency'lerden geçer;
+    DB session'ları ve token başına kullanıcı batch boyunca bir kez çözülüp paylaşılır.
+    """
+    if len(payload.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"En fazla {settings.BATCH_MAX_REQUESTS} alt istek gönderilebilir"
+        )
+
+    # Alt istekler aynı session'ları paylaştığı için sırayla çalışır (Session thread-safe değildir)
+    state = {"size": len(payload.requests), "sessions": {}, "users": {}}
+    responses = []
+    try:
+        for sub_request in payload.requests:
+            responses.append(await _run_sub_request(request, sub_request, state))
+            for db in state["sessions"].values():
+                await run_in_threadpool(db.finish)
+    finally:
+        for db in state["sessions"].values():
+            await run_in_threadpool(db.close)
+    return {"responses": responses}
@@ -0,0 +1,91 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from api.v1.dependencies.auth import get_current_superadmin
+from core import jobs
+from db.models.job import Job
+from db.models.user import User
+from db.session import get_db
+from schemas.job import JobCreate, JobResponse, JobStats
+
+router = APIRouter()
+
+
+@router.post("/enqueue", response_model=JobResponse)
+def enqueue_job(
+    data: JobCreate,
+    current_user: User = Depends(get_current_superadmin),
+    db: Session = Depends(get_db),
+):
+    """
+    Kuyruğa yeni job ekler
+    """
+    if data.type not in jobs.load_handlers():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Bilinmeyen job tipi")
+    job = jobs.enqueue(
+        db,
+        data.type,
+        data.payload,
+        delay_seconds=data.delay_seconds,
+        max_attempts=data.max_attempts,
+    )
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+@router.get("/list", response_model=List[JobResponse])
+def job_list(
+    job_status: Optional[str] = Query(None, alias="status", description="queued, running, done, failed"),
+    job_type: Optional[str] = Query(None, alias="type"),
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_superadmin),
+    db: Session = Depends(get_db),
+):
+    """
+    Job'ları en yeniden eskiye listeler
+    """
+    stmt = select(Job).order_by(Job.id.desc()).limit(limit)
+    if job_status:
+        stmt = stmt.where(Job.status == job_status)
+    if job_type:
+        stmt = stmt.where(Job.type == job_type)
+    return db.execute(stmt).scalars().all()
+
+
+@router.get("/stats", response_model=JobStats)
+def job_stats(
+    current_user: User = Depends(get_current_superadmin),
+    db: Session = Depends(get_db),
+):
+    """
+    Job tipi ve durumu başına sayı ve ortalama çalışma süresini getirir
+    """
+    duration = func.extract("epoch", Job.finished_at - Job.started_at)
+    stmt = (
+        select(Job.type, Job.status, func.count(Job.id), func.avg(duration))
+        .group_by(Job.type, Job.status)
+        .order_by(Job.type, Job.status)
+    )
+    return {
+        "stats": [
+            {"type": job_type, "status": job_status, "count": count, "avg_seconds": avg_seconds}
+            for job_type, job_status, count, avg_seconds in db.execute(stmt)
+        ]
+    }
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def job_detail(
+    job_id: int,
+    current_user: User = Depends(get_current_superadmin),
+    db: Session = Depends(get_db),
+):
+    """
+    Job detayını getirir
+    """
+    job = db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
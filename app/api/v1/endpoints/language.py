@@ -1,21 +1,34 @@
 from fastapi import APIRouter, Depends, Path
 from fastapi import HTTPException
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 from api.v1.dependencies.auth import get_current_user
 from schemas.language import UserResponse
 from db.models.user import User
-from db.session import get_db
+from db.session import get_db, mark_user_write
 from db.models.language import Language
+from core import cache_bus
+from core.cache import CachedRoute, cache_response
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
+
+LANGUAGE_LIST = select(Language)
+LANGUAGES_BY_ID = select(Language).where(Language.id.in_(bindparam("language_ids", expanding=True)))
+USER_WITH_LANGUAGES = (
+    select(User)
+    .options(joinedload(User.native_language), joinedload(User.target_language))
+    .where(User.id == bindparam("user_id"))
+    .execution_options(populate_existing=True)
+)
 
 
 @router.get("/list")
+@cache_response(entity="language", per_user=False)
 def language_list(db: Session = Depends(get_db)):
     """
     Tüm dilleri getirir
     """
-    languages = db.query(Language).all()
+    languages = db.execute(LANGUAGE_LIST).scalars().all()
     return {"message": "Language list", "languages": languages}
 
 
@@ -32,20 +45,18 @@ def select_language(
     """
     Kullanıcının anadil ve hedef dilini kaydetmek için anadil ve hedef dilin id'sini gönder
     """
-    native_language = db.query(Language).filter(Language.id == native_language_id).first()
-    target_language = db.query(Language).filter(Language.id == target_language_id).first()
+    language_ids = {native_language_id, target_language_id}
+    languages = db.execute(LANGUAGES_BY_ID, {"language_ids": list(language_ids)}).scalars().all()
     
-    if not native_language or not target_language:
+    if len(languages) != len(language_ids):
         raise HTTPException(status_code=404, detail="Language not found")
 
     current_user.native_language_id = native_language_id
     current_user.target_language_id = target_language_id
+    cache_bus.publish(db, "user", current_user.id)
     db.commit()
-    user_with_languages = db.query(User)\
-        .options(
-            joinedload(User.native_language),
-            joinedload(User.target_language)
-        )\
-        .filter(User.id == current_user.id)\
-        .first()
+    mark_user_write(current_user.id)
+    user_with_languages = db.execute(
+        USER_WITH_LANGUAGES, {"user_id": current_user.id}
+    ).unique().scalars().first()
     return user_with_languages
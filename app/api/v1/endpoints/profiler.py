@@ -0,0 +1,82 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from api.v1.dependencies.auth import get_current_superadmin
+from core.profiler import profiler
+from db.models.user import User
+from schemas.profiler import ProfileArm, ProfileCapture, ProfileReport
+
+router = APIRouter()
+
+
+def _not_found():
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Capture not found")
+
+
+@router.post("/arm", response_model=ProfileCapture)
+def arm_profile(
+    data: ProfileArm,
+    current_user: User = Depends(get_current_superadmin),
+):
+    """
+    Path desenine uyan sonraki `count` isteği veya X-Profile-Token başlığı dönen token olan
+    istekleri profillemek için capture kurar. Aynı anda tek capture kurulabilir.
+    """
+    capture = profiler.arm(data.path, data.method, data.count, data.ttl_seconds)
+    if capture is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Zaten kurulu bir capture var")
+    return capture.summary()
+
+
+@router.get("/list", response_model=List[ProfileCapture])
+def profile_list(current_user: User = Depends(get_current_superadmin)):
+    """
+    Bu worker'daki capture'ları en yeniden eskiye listeler
+    """
+    return profiler.list()
+
+
+@router.get("/{capture_id}", response_model=ProfileReport)
+def profile_report(
+    capture_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_superadmin),
+):
+    """
+    Fonksiyon bazında CPU özeti ve çalışan SQL'leri getirir
+    """
+    report = profiler.report(capture_id, limit)
+    if report is None:
+        raise _not_found()
+    return report
+
+
+@router.get("/{capture_id}/collapsed", response_class=PlainTextResponse)
+def profile_collapsed(
+    capture_id: str,
+    current_user: User = Depends(get_current_superadmin),
+):
+    """
+    Flame graph araçlarıyla (flamegraph.pl, speedscope) açılabilen collapsed-stack dosyası
+    """
+    collapsed = profiler.collapsed(capture_id)
+    if collapsed is None:
+        raise _not_found()
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="profile-{capture_id}.folded"'},
+    )
+
+
+@router.delete("/{capture_id}", response_model=ProfileCapture)
+def cancel_profile(
+    capture_id: str,
+    current_user: User = Depends(get_current_superadmin),
+):
+    """
+    Kurulu capture'ı iptal eder (toplanmış veriler korunur)
+    """
+    capture = profiler.cancel(capture_id)
+    if capture is None:
+        raise _not_found()
+    return capture.summary()
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import DataError
+from core.config import settings
+from core.grading import is_correct_answer
+from core.security import verify_token
+from crud.sync import record_attempts
+from crud.user import get_user_by_id
+from crud.word import get_words_near_ability
+from db.session import SessionLocal, mark_user_write
+from schemas.sync import MAX_INT32, MAX_RESPONSE_TIME_MS
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class QuizSession:
+    """
+    Bir WebSocket quiz oturumunun bellekteki durumu: sorular, cevaplar ve kaydedilmeyi bekleyen denemeler
+    """
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.id = uuid.uuid4().hex
+        self.questions = {}
+        self.answered = set()
+        self.pending = []
+        self.round = 0
+        self.answered_count = 0
+        self.correct = 0
+        self.last_event = time.monotonic()
+        self.last_flush = time.monotonic()
+
+    def load_questions(self, words) -> list:
+        # Yeni start yeni bir tur başlatır: aynı kelime tekrar sorulabilir ve ayrı deneme olarak kaydedilir
+        self.questions = {word.id: word for word in words}
+        self.answered = set()
+        self.round += 1
+        self.last_event = time.monotonic()
+        return [
+            {"word_id": word.id, "text": word.text, "pronunciation": word.pronunciation}
+            for word in words
+        ]
+
+    def answer(self, word_id: int, answer: str, response_time: Optional[int]) -> dict:
+        word = self.questions[word_id]
+        now = time.monotonic()
+        if response_time is None:
+            response_time = min(int((now - self.last_event) * 1000), MAX_RESPONSE_TIME_MS)
+        self.last_event = now
+
+        correct = is_correct_answer(word.translation, answer)
+        self.correct += int(correct)
+        self.answered.add(word_id)
+        self.answered_count += 1
+        self.pending.append({
+            "client_id": f"ws-{self.id}-{self.round}-{word_id}",
+            "word_id": word_id,
+            "user_answer": answer[:255],
+            "response_time": response_time,
+            "attempted_at": datetime.now(timezone.utc),
+        })
+        return {"type": "result", "word_id": word_id, "correct": correct, "expected": word.translation}
+
+    def should_checkpoint(self) -> bool:
+        return bool(self.pending) and (
+            len(self.pending) >= settings.QUIZ_CHECKPOINT_ANSWERS
+            or time.monotonic() - self.last_flush >= settings.QUIZ_CHECKPOINT_SECONDS
+        )
+
+    def checkpoint_timeout(self) -> Optional[float]:
+        """
+        Zamana bağlı checkpoint'e kalan süre; bekleyen deneme yoksa None (süresiz beklenir)
+        """
+        if not self.pending:
+            return None
+        return max(0.0, settings.QUIZ_CHECKPOINT_SECONDS - (time.monotonic() - self.last_flush))
+
+    def take_pending(self) -> list:
+        pending, self.pending = self.pending, []
+        self.last_flush = time.monotonic()
+        return pending
+
+    def restore_pending(self, attempts: list) -> None:
+        """
+        Kaydedilemeyen denemeleri bir sonraki checkpoint'te tekrar denenmek üzere geri koyar
+        """
+        self.pending = attempts + self.pending
+
+
+def _authenticate(token: Optional[str]):
+    payload = verify_token(token) if token else None
+    if payload is None or payload.get("type") != "access" or payload.get("sub") is None:
+        return None
+    db = SessionLocal()
+    try:
+        user = get_user_by_id(db, user_id=int(payload["sub"]))
+        if user is None or not user.is_active:
+            return None
+        return {"id": user.id, "target_language_id": user.target_language_id}
+    finally:
+        db.close()
+
+
+def _load_words(user_id: int, language_id: int, level_id: Optional[int], count: int):
+    db = SessionLocal()
+    try:
+        words = get_words_near_ability(db, user_id, language_id, level_id=level_id, limit=count)
+        db.expunge_all()
+        return words
+    finally:
+        db.close()
+
+
+def _record(user_id: int, attempts: list) -> dict:
+    db = SessionLocal()
+    try:
+        return record_attempts(db, user_id, attempts)
+    finally:
+        db.close()
+
+
+def _persist(user_id: int, attempts: list) -> dict:
+    """
+    Biriken denemeleri ve ilerleme farkını tek transaction'da yazar (client_id ile tekrar güvenli).
+    Veritabanı bir satırın değerini kabul etmezse (DataError) denemeler tek tek yazılır ve
+    saklanamayanlar atılır; aksi halde aynı satır her checkpoint'te hatayı tekrarlardı.
+    """
+    try:
+        result = _record(user_id, attempts)
+    except DataError:
+        result = {"accepted": 0, "duplicates": 0, "rejected": 0}
+        for attempt in attempts:
+            try:
+                single = _record(user_id, [attempt])
+            except DataError:
+                logger.warning("Quiz attempt %s dropped, it cannot be stored", attempt["client_id"], exc_info=True)
+                result["rejected"] += 1
+                continue
+            for key in result:
+                result[key] += single[key]
+    if result["accepted"]:
+        mark_user_write(user_id)
+    return result
+
+
+def _optional_int(value, minimum: int = 0, maximum: int = MAX_INT32) -> Optional[int]:
+    """
+    Mesajdaki tam sayı alanını döner; alan yoksa None, tam sayı değilse veya aralık dışındaysa ValueError
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or not minimum <= value <= maximum:
+        raise ValueError(value)
+    return value
+
+
+async def _checkpoint(websocket: WebSocket, session: QuizSession) -> bool:
+    """
+    Bekleyen denemeleri kaydeder; hata olursa denemeleri geri koyar ve istemciye hata mesajı gönderir
+    """
+    attempts = session.take_pending()
+    try:
+        await run_in_threadpool(_persist, session.user_id, attempts)
+        return True
+    except Exception:
+        logger.exception("Quiz session %s could not persist %d attempts", session.id, len(attempts))
+        session.restore_pending(attempts)
+        await websocket.send_json({"type": "error", "detail": "Cevaplar kaydedilemedi, tekrar denenecek"})
+        return False
+
+
+@router.websocket("/session")
+async def quiz_session(websocket: WebSocket, token: Optional[str] = Query(None)):
+    """
+    Quiz oturumu: bağlantı başında bir kez kimlik doğrulanır, cevaplar anında değerlendirilir,
+    denemeler checkpoint'lerde ve oturum sonunda toplu kaydedilir.
+
+    İstemci mesajları:
+        {"type": "start", "language_id": 1, "level_id": 2, "count": 20}
+        {"type": "answer", "word_id": 10, "answer": "...", "response_time": 1500}
+        {"type": "finish"}
+    """
+    authorization = websocket.headers.get("authorization", "")
+    if not token and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+
+    user = await run_in_threadpool(_authenticate, token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    session = QuizSession(user["id"])
+    try:
+        while True:
+            try:
+                # Cevap gelmese de bekleyen denemeler QUIZ_CHECKPOINT_SECONDS içinde kaydedilir
+                message = await asyncio.wait_for(websocket.receive_json(), session.checkpoint_timeout())
+                message_type = message.get("type")
+            except asyncio.TimeoutError:
+                await _checkpoint(websocket, session)
+                continue
+            except (ValueError, AttributeError):
+                await websocket.send_json({"type": "error", "detail": "Geçersiz mesaj"})
+                continue
+
+            if message_type == "start":
+                try:
+                    language_id = _optional_int(message.get("language_id"), minimum=1) or user["target_language_id"]
+                    level_id = _optional_int(message.get("level_id"), minimum=1)
+                    count = _optional_int(message.get("count", 20))
+                except ValueError:
+                    await websocket.send_json({"type": "error", "detail": "Geçersiz start mesajı"})
+                    continue
+                if language_id is None:
+                    await websocket.send_json({"type": "error", "detail": "Hedef dil seçilmemiş"})
+                    continue
+                count = max(1, min(20 if count is None else count, settings.QUIZ_MAX_QUESTIONS))
+                words = await run_in_threadpool(
+                    _load_words, session.user_id, language_id, level_id, count
+                )
+                await websocket.send_json({"type": "questions", "session_id": session.id,
+                                           "questions": session.load_questions(words)})
+
+            elif message_type == "answer":
+                try:
+                    word_id = _optional_int(message.get("word_id"), minimum=1)
+                except ValueError:
+                    word_id = None
+                if word_id not in session.questions or word_id in session.answered:
+                    await websocket.send_json({"type": "error", "detail": "Geçersiz soru"})
+                    continue
+                try:
+                    response_time = _optional_int(message.get("response_time"), maximum=MAX_RESPONSE_TIME_MS)
+                except ValueError:
+                    await websocket.send_json({"type": "error", "detail": "Geçersiz cevap süresi"})
+                    continue
+                await websocket.send_json(
+                    session.answer(word_id, str(message.get("answer", "")), response_time)
+                )
+                if session.should_checkpoint():
+                    await _checkpoint(websocket, session)
+
+            elif message_type == "finish":
+                if session.pending and not await _checkpoint(websocket, session):
+                    # İstemci finish'i tekrar gönderebilir; bağlantı koparsa finally tekrar dener
+                    continue
+                await websocket.send_json({
+                    "type": "summary",
+                    "answered": session.answered_count,
+                    "correct": session.correct,
+                })
+                await websocket.close()
+                return
+
+            else:
+                await websocket.send_json({"type": "error", "detail": "Bilinmeyen mesaj tipi"})
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Bağlantı beklenmedik kapansa da cevaplar kaybolmasın
+        if session.pending:
+            try:
+                await run_in_threadpool(_persist, session.user_id, session.take_pending())
+            except Exception:
+                logger.exception("Quiz session %s could not persist pending attempts", session.id)
@@ -0,0 +1,64 @@
+import base64
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from api.v1.dependencies.auth import get_current_user, get_current_user_read
+from core.config import settings
+from crud.sync import record_attempts, get_progress_changes
+from db.models.user import User
+from db.session import get_db, get_read_db, mark_user_write
+from schemas.sync import AttemptUploadBatch, AttemptUploadResult, ProgressChanges
+
+router = APIRouter()
+
+
+def encode_cursor(change_seq: int) -> str:
+    return base64.urlsafe_b64encode(f"p:{change_seq}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded).decode().partition(":")
+        if prefix != "p":
+            raise ValueError(cursor)
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Geçersiz cursor")
+
+
+@router.post("/attempts", response_model=AttemptUploadResult)
+def upload_attempts(
+    data: AttemptUploadBatch,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Çevrimdışı biriken kelime denemelerini toplu olarak yükler (aynı client_id tekrar sayılmaz)
+    """
+    if len(data.attempts) > settings.SYNC_MAX_ATTEMPTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tek istekte en fazla {settings.SYNC_MAX_ATTEMPTS} deneme gönderilebilir"
+        )
+
+    result = record_attempts(db, current_user.id, [attempt.dict() for attempt in data.attempts])
+    if result["accepted"]:
+        mark_user_write(current_user.id)
+    return result
+
+
+@router.get("/progress", response_model=ProgressChanges)
+def download_progress(
+    cursor: str = Query(None, description="Önceki yanıttaki cursor, ilk senkronizasyonda boş"),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Cursor'dan sonra değişen ilerleme kayıtlarını getirir
+    """
+    after_seq = decode_cursor(cursor) if cursor else 0
+    changes, has_more = get_progress_changes(db, current_user.id, after_seq, limit)
+    if changes:
+        after_seq = changes[-1].change_seq
+    return {"changes": changes, "cursor": encode_cursor(after_seq), "has_more": has_more}
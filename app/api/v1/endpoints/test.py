@@ -2,10 +2,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, Header
 from typing import Optional
 from db.models.user import User
 from sqlalchemy.orm import Session
-from db.session import get_db
+from db.session import get_db, get_read_db, hold_stats, pool_stats
 from core.config import settings
 from pydantic import BaseModel
 from db.models.language import Language
+from core.cache import response_cache
+from core import cache_bus, concurrency, jobs, vocab_pack
+from crud.word import bulk_create_words
+from schemas.word import WordImport
 
 
 router = APIRouter()
@@ -32,7 +36,7 @@ def verify_test_api_key_query(api_key: Optional[str] = None):
     return True
 
 @router.get("/user-list")
-def user_list(db: Session = Depends(get_db), api_key: Optional[str] = Query(None, description="Test API key")):
+def user_list(db: Session = Depends(get_read_db), api_key: Optional[str] = Query(None, description="Test API key")):
     _ = verify_test_api_key_query(api_key)
     users = db.query(User).all()
     return {"users": users}
@@ -47,12 +51,47 @@ def language_create(data: LanguageCreate, db: Session = Depends(get_db), api_key
     _ = verify_test_api_key_query(api_key)
     language = Language(name=data.name, code=data.code)
     db.add(language)
+    cache_bus.publish(db, "language")
     db.commit()
     db.refresh(language)
     return {"message": "Language created", "language": language}
 
 @router.get("/language/list")
-def language_list(db: Session = Depends(get_db), api_key: Optional[str] = Query(None, description="Test API key")):
+def language_list(db: Session = Depends(get_read_db), api_key: Optional[str] = Query(None, description="Test API key")):
     _ = verify_test_api_key_query(api_key)
     languages = db.query(Language).all()
-    return {"message": "Language list", "languages": languages}
\ No newline at end of file
+    return {"message": "Language list", "languages": languages}
+
+@router.get("/cache/stats")
+def cache_stats(api_key: Optional[str] = Query(None, description="Test API key")):
+    _ = verify_test_api_key_query(api_key)
+    return {"response_cache": response_cache.stats()}
+
+
+@router.get("/concurrency/stats")
+def concurrency_stats(api_key: Optional[str] = Query(None, description="Test API key")):
+    _ = verify_test_api_key_query(api_key)
+    return {"bulkheads": concurrency.stats()}
+
+
+@router.get("/db/stats")
+def db_stats(api_key: Optional[str] = Query(None, description="Test API key")):
+    _ = verify_test_api_key_query(api_key)
+    return {"pool": pool_stats(), "connection_hold": hold_stats.snapshot()}
+
+
+@router.post("/word/import")
+def word_import(data: WordImport, db: Session = Depends(get_db), api_key: Optional[str] = Query(None, description="Test API key")):
+    _ = verify_test_api_key_query(api_key)
+    for language_id in {word.language_id for word in data.words}:
+        cache_bus.publish(db, "word", language_id)
+    count = bulk_create_words(db, [word.dict() for word in data.words])
+    for language_id, level_id in {(word.language_id, word.level_id) for word in data.words}:
+        pack = vocab_pack.mark_stale(db, language_id, level_id)
+        if pack is not None:
+            # Paketi ilk indirme isteğini beklemeden arka planda derle
+            jobs.enqueue(db, "vocab_pack.build", pack)
+    for language_id in {word.language_id for word in data.words}:
+        jobs.enqueue(db, "word_catalog.build", {"language_id": language_id})
+    db.commit()
+    return {"message": "Words imported", "count": count}
@@ -1,14 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from db.models.user import User
 from api.v1.dependencies.auth import get_current_user
-from db.session import get_db
+from db.session import get_db, mark_user_write
 from sqlalchemy.orm import Session
 from schemas.auth import UserResponse
 from schemas.user import PasswordChange, UserUpdate
+from fastapi.responses import FileResponse, StreamingResponse
+from core import jobs
+from core.cache import CachedRoute, cache_response
+from api.v1.dependencies.concurrency import use_bulkhead
+from core.export import iter_user_export, list_user_exports, user_export_path
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("/me", response_model=UserResponse)
+@cache_response(entity="user")
 def get_current_user_info(current_user: User = Depends(get_current_user)):
     """
     Mevcut kullanıcı bilgilerini getirir
@@ -31,10 +37,12 @@ def update_current_user(
         user_id=current_user.id,
         **user_data.dict(exclude_unset=True)
     )
+    mark_user_write(current_user.id)
     
     return updated_user
 
 @router.post("/change-password")
+@use_bulkhead("auth")
 def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user),
@@ -56,5 +64,58 @@ def change_password(
     new_hashed_password = get_password_hash(password_data.new_password)
     from crud.user import update_user
     update_user(db=db, user_id=current_user.id, hashed_password=new_hashed_password)
+    mark_user_write(current_user.id)
     
-    return {"message": "Şifre başarıyla değiştirildi"}
\ No newline at end of file
+    return {"message": "Şifre başarıyla değiştirildi"}
+
+@router.get("/me/export")
+@use_bulkhead("download")
+def export_current_user_data(current_user: User = Depends(get_current_user)):
+    """
+    Kullanıcının tüm verilerini (profil, ilerleme, denemeler) ZIP olarak stream eder
+    """
+    return StreamingResponse(
+        iter_user_export(current_user.id),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="gurulingua-export-{current_user.id}.zip"'},
+    )
+
+@router.post("/me/export/job")
+def enqueue_current_user_export(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Kullanıcı verisi export'unu arka planda hazırlanmak üzere kuyruğa ekler;
+    kullanıcının bekleyen veya çalışan export job'ı varsa yenisini eklemeden onu döner
+    """
+    job, created = jobs.enqueue_unique(db, "user.export", {"user_id": current_user.id})
+    db.commit()
+    return {
+        "message": "Export kuyruğa eklendi" if created else "Export zaten kuyrukta",
+        "job_id": job.id,
+        "files_url": "/api/v1/user/me/export/files",
+    }
+
+@router.get("/me/export/files")
+def list_current_user_exports(current_user: User = Depends(get_current_user)):
+    """
+    Arka planda hazırlanmış export arşivlerini listeler
+    """
+    return {
+        "exports": [
+            {**export, "url": f"/api/v1/user/me/export/files/{export['file_name']}"}
+            for export in list_user_exports(current_user.id)
+        ]
+    }
+
+@router.get("/me/export/files/{file_name}")
+@use_bulkhead("download")
+def download_current_user_export(file_name: str, current_user: User = Depends(get_current_user)):
+    """
+    Kullanıcıya ait hazır export arşivini indirir
+    """
+    path = user_export_path(current_user.id, file_name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+    return FileResponse(path, media_type="application/zip", filename=file_name)
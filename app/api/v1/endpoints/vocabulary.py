@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+from api.v1.dependencies.concurrency import use_bulkhead
+from core import vocab_pack
+from db.session import get_read_db
+
+router = APIRouter()
+
+PACK_CODE_PATTERN = r"^[A-Za-z0-9]{2}$"
+
+
+def _ensure_pack(db: Session, language_code: str, level_code: str) -> dict:
+    manifest = vocab_pack.ensure_pack(db, language_code, level_code)
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dil veya seviye bulunamadı"
+        )
+    return manifest
+
+
+@router.get("/{language_code}/{level_code}/manifest")
+def pack_manifest(
+    language_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Language code (EN, TR, DE)"),
+    level_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Level code (A1, A2, ...)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Kelime paketinin güncel versiyon bilgisini getirir
+    """
+    return _ensure_pack(db, language_code.upper(), level_code.upper())
+
+
+@router.get("/{language_code}/{level_code}/pack")
+@use_bulkhead("download")
+def pack_download(
+    request: Request,
+    language_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Language code (EN, TR, DE)"),
+    level_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Level code (A1, A2, ...)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Seviyenin tüm kelimelerini içeren sıkıştırılmış paketi indirir (ETag ve Range destekli)
+    """
+    language_code, level_code = language_code.upper(), level_code.upper()
+    manifest = _ensure_pack(db, language_code, level_code)
+    path = vocab_pack.pack_path(language_code, level_code, manifest["version"])
+    return vocab_pack.serve_file(request, path, f'"{manifest["version"]}"')
+
+
+@router.get("/{language_code}/{level_code}/delta")
+@use_bulkhead("download")
+def pack_delta(
+    request: Request,
+    language_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Language code (EN, TR, DE)"),
+    level_code: str = Path(..., pattern=PACK_CODE_PATTERN, description="Level code (A1, A2, ...)"),
+    from_version: str = Query(..., description="İstemcideki paket versiyonu"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    İstemcideki versiyondan güncel versiyona kadar değişen kelimeleri indirir
+    """
+    language_code, level_code = language_code.upper(), level_code.upper()
+    manifest = _ensure_pack(db, language_code, level_code)
+    if from_version == manifest["version"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": f'"{from_version}"'})
+
+    if from_version not in manifest["versions"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Versiyon bulunamadı, tam paketi indirin"
+        )
+
+    path = vocab_pack.build_delta(language_code, level_code, from_version, manifest["version"])
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Versiyon bulunamadı, tam paketi indirin"
+        )
+    return vocab_pack.serve_file(request, path, f'"{from_version}-{manifest["version"]}"')
@@ -0,0 +1,66 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from api.v1.dependencies.auth import get_current_user_read
+from core import autocomplete
+from core.config import settings
+from crud.word import search_words, search_example_sentences, get_words_near_ability
+from db.models.user import User
+from db.session import get_read_db
+from schemas.word import WordResponse, WordSuggestion
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=List[WordResponse])
+def word_search(
+    language_id: int = Query(..., description="Language ID"),
+    q: str = Query(..., min_length=1, max_length=100, description="Aranacak metin"),
+    in_sentences: bool = Query(False, description="Örnek cümlelerde ara"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Kelime, çeviri veya örnek cümlelerde arama yapar
+    """
+    if in_sentences:
+        return search_example_sentences(db, language_id, q, limit=limit)
+    return search_words(db, language_id, q, limit=limit)
+
+
+@router.get("/autocomplete", response_model=List[WordSuggestion])
+def word_autocomplete(
+    language_id: int = Query(..., description="Language ID"),
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Kelime ön eki ile otomatik tamamlama önerileri getirir
+    """
+    index = autocomplete.get_index(language_id) if settings.AUTOCOMPLETE_ENABLED else None
+    if index is not None:
+        return index.complete(prefix, limit=limit)
+
+    # Index kapalı veya arka planda ilk kez oluşturuluyor
+    return [
+        {"id": word.id, "text": word.text, "translation": word.translation}
+        for word in search_words(db, language_id, prefix, limit=limit)
+    ]
+
+
+@router.get("/recommended", response_model=List[WordResponse])
+def word_recommended(
+    language_id: Optional[int] = Query(None, description="Language ID, boşsa kullanıcının hedef dili"),
+    level_id: Optional[int] = Query(None, description="Level ID"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Quiz için zorluğu kullanıcının seviyesine en yakın kelimeleri getirir
+    """
+    language_id = language_id or current_user.target_language_id
+    if language_id is None:
+        raise HTTPException(status_code=400, detail="Hedef dil seçilmemiş")
+    return get_words_near_ability(db, current_user.id, language_id, level_id=level_id, limit=limit)
@@ -0,0 +1,193 @@
+import bisect
+import logging
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+from core.config import settings
+from crud.word import get_autocomplete_rows, get_autocomplete_signature
+from db.session import ReadSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Başarısız bir index oluşturmadan sonra yeniden deneme aralığı
+RETRY_SECONDS = 30
+
+
+def normalize_prefix(value: str) -> str:
+    return " ".join(value.casefold().split())
+
+
+class StringColumn:
+    """
+    Dizeleri tek bir UTF-8 blob ve offset dizisinde tutar; dize başına Python nesnesi oluşmaz.
+    bisect ile kullanılabilen salt okunur bir dizidir.
+    """
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, values: Iterable[str]):
+        blob = bytearray()
+        offsets = array("Q", [0])
+        for value in values:
+            blob += value.encode()
+            offsets.append(len(blob))
+        self._blob = bytes(blob)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        return self._blob[self._offsets[position]:self._offsets[position + 1]].decode()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._blob) + self._offsets.itemsize * len(self._offsets)
+
+
+class PrefixIndex:
+    """
+    Bir dilin kelimeleri için sıralı anahtar dizisi üzerinde prefix arama.
+    Anahtarlar ve kelimeler sütun halinde (blob + offset, array) tutulur; öneri dict'leri yalnızca
+    dönen sonuçlar için oluşturulur. Arama bisect ile O(log n + limit) sürer.
+    """
+
+    def __init__(self, rows, signature=None, generation=None):
+        ids = array("q")
+        texts = []
+        translations = []
+        entries = []
+        for row, (word_id, text, translation) in enumerate(rows):
+            ids.append(word_id)
+            texts.append(text)
+            translations.append(translation or "")
+            entries.append((normalize_prefix(text), word_id, row))
+            if translation:
+                entries.append((normalize_prefix(translation), word_id, row))
+        entries.sort()
+
+        self._keys = StringColumn(entry[0] for entry in entries)
+        self._rows = array("I", (entry[2] for entry in entries))
+        self._ids = ids
+        self._texts = StringColumn(texts)
+        self._translations = StringColumn(translations)
+        self.signature = signature
+        self.generation = generation
+        self.checked_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self._keys.nbytes + self._texts.nbytes + self._translations.nbytes
+            + self._rows.itemsize * len(self._rows) + self._ids.itemsize * len(self._ids)
+        )
+
+    def complete(self, prefix: str, limit: int = 10) -> List[dict]:
+        prefix = normalize_prefix(prefix)
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self._keys, prefix)
+        results = []
+        seen = set()
+        for position in range(start, len(self._keys)):
+            if not self._keys[position].startswith(prefix):
+                break
+            row = self._rows[position]
+            if row in seen:
+                continue
+            seen.add(row)
+            results.append({
+                "id": self._ids[row],
+                "text": self._texts[row],
+                "translation": self._translations[row],
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+
+_indexes: Dict[int, PrefixIndex] = {}
+_lock = threading.Lock()
+_building = set()
+_retry_at: Dict[int, float] = {}
+# invalidate() çağrıları index'leri hemen düşürmez, nesillerini eskitir
+_epoch = 0
+_generations: Dict[int, int] = {}
+
+
+def _generation(language_id: int) -> tuple:
+    return _epoch, _generations.get(language_id, 0)
+
+
+def get_index(language_id: int) -> Optional[PrefixIndex]:
+    """
+    Dilin prefix index'ini döner. Index yoksa, geçersiz kılındıysa veya TTL dolduysa arka planda
+    yenilenir; bu sırada eldeki index (varsa) kullanılmaya devam eder. Hiç index yoksa None döner.
+    """
+    index = _indexes.get(language_id)
+    now = time.monotonic()
+    if (
+        index is None
+        or index.generation != _generation(language_id)
+        or now - index.checked_at >= settings.AUTOCOMPLETE_TTL_SECONDS
+    ):
+        _schedule_refresh(language_id, now)
+    return index
+
+
+def _schedule_refresh(language_id: int, now: float) -> None:
+    with _lock:
+        if language_id in _building or now < _retry_at.get(language_id, 0.0):
+            return
+        _building.add(language_id)
+    threading.Thread(
+        target=_refresh, args=(language_id,), name=f"autocomplete-{language_id}", daemon=True
+    ).start()
+
+
+def _refresh(language_id: int) -> None:
+    """
+    Kelimeler değişmediyse (imza aynı) index'i yeniden oluşturmadan tazeler
+    """
+    generation = _generation(language_id)
+    try:
+        with ReadSessionLocal() as db:
+            signature = get_autocomplete_signature(db, language_id)
+            current = _indexes.get(language_id)
+            if current is not None and current.signature == signature:
+                current.generation = generation
+                current.checked_at = time.monotonic()
+                return
+            started = time.perf_counter()
+            rows = get_autocomplete_rows(db, language_id)
+        index = PrefixIndex(rows, signature, generation)
+        with _lock:
+            _indexes[language_id] = index
+        logger.info(
+            "Autocomplete index for language %s: %d keys, %d bytes in %.2fs",
+            language_id, len(index), index.nbytes, time.perf_counter() - started,
+        )
+    except Exception:
+        logger.exception("Autocomplete index for language %s could not be built", language_id)
+        _retry_at[language_id] = time.monotonic() + RETRY_SECONDS
+    finally:
+        with _lock:
+            _building.discard(language_id)
+
+
+def invalidate(language_id: int = None) -> None:
+    """
+    Kelimeler değiştiğinde index'i eskitir; bir sonraki istek arka planda yenilemeyi başlatır
+    """
+    global _epoch
+    with _lock:
+        if language_id is None:
+            _epoch += 1
+            _retry_at.clear()
+        else:
+            _generations[language_id] = _generations.get(language_id, 0) + 1
+            _retry_at.pop(language_id, None)
@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from inspect import isasyncgenfunction
+from itertools import count
+from typing import Callable, Optional
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from core.compression import choose_encoding, compress
+from core.config import settings
+from core.security import verify_token
+
+
+# (entity, key) -> versiyon; yazma işlemleri versiyonu artırır, eski cache kayıtları kullanılmaz hale gelir.
+# Versiyonlar tek bir artan sayaçtan alınır ve en eski yazılanlar RESPONSE_CACHE_MAX_VERSIONS'ta atılır;
+# atılan anahtarlar en az atılan son versiyonu döner, böylece bir anahtarın versiyonu hiç geri gitmez.
+_versions = OrderedDict()
+_versions_lock = threading.Lock()
+_version_counter = count(1)
+_version_floor = 0
+
+
+def get_version(entity: str, key) -> int:
+    return _versions.get((entity, key), _version_floor)
+
+
+def bump_version(entity: str, key="*") -> int:
+    """
+    Varlığın versiyonunu artırır (cache'lenmiş yanıtları geçersiz kılar)
+    """
+    global _version_floor
+    with _versions_lock:
+        version = next(_version_counter)
+        _versions[(entity, key)] = version
+        _versions.move_to_end((entity, key))
+        while len(_versions) > settings.RESPONSE_CACHE_MAX_VERSIONS:
+            _, evicted = _versions.popitem(last=False)
+            _version_floor = max(_version_floor, evicted)
+    return version
+
+
+class CacheEntry:
+    __slots__ = ("body", "media_type", "etag", "encoded")
+
+    def __init__(self, body: bytes, media_type: str, etag: str):
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+        self.encoded = {}  # encoding -> önceden sıkıştırılmış byte'lar
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+
+class ResponseCache:
+    """
+    Serialize edilmiş yanıt byte'larını boyut sınırlı LRU olarak saklar
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def get(self, key) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, entry: CacheEntry) -> None:
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            self._entries[key] = entry
+            self._size += size
+            self._evict()
+
+    def get_encoded(self, key, entry: CacheEntry, encoding: str) -> bytes:
+        """
+        Kaydın sıkıştırılmış halini döner, ilk istekte sıkıştırıp kaydın yanında saklar
+        """
+        data = entry.encoded.get(encoding)
+        if data is not None:
+            return data
+        data = compress(entry.body, encoding)
+        with self._lock:
+            if encoding not in entry.encoded:
+                entry.encoded[encoding] = data
+                if self._entries.get(key) is entry:
+                    self._size += len(data)
+                    self._evict()
+        return data
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
+
+
+class CacheOptions:
+    __slots__ = ("entity", "per_user")
+
+    def __init__(self, entity: str, per_user: bool):
+        self.entity = entity
+        self.per_user = per_user
+
+
+def cache_response(entity: str, per_user: bool = True) -> Callable:
+    """
+    GET endpoint'inin yanıtını route, kullanıcı ve varlık versiyonuna göre cache'ler.
+    Router'ın route_class'ı CachedRoute olmalıdır. Cache'lenen endpoint'ler primary'den okumalıdır:
+    geride kalan bir replica'dan dolan eski veri, yeni versiyon altında bir sonraki yazmaya kadar kalır.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__response_cache__ = CacheOptions(entity, per_user)
+        return endpoint
+    return decorator
+
+
+def cache_guard(dependency: Callable) -> Callable:
+    """
+    Router dependency'sini cache'ten yanıtlanan isteklerde de çalışacak şekilde işaretler
+    (bulkhead, rate limit). Dependency yalnızca Request parametresi almalıdır.
+    """
+    dependency.__cache_guard__ = True
+    return dependency
+
+
+@asynccontextmanager
+async def _run_guard(guard: Callable, request: Request):
+    if isasyncgenfunction(guard):
+        async with asynccontextmanager(guard)(request):
+            yield
+        return
+    result = guard(request)
+    if asyncio.iscoroutine(result):
+        await result
+    yield
+
+
+def _principal_from_request(request: Request) -> Optional[str]:
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token)
+    if payload is None or payload.get("type") != "access" or payload.get("sub") is None:
+        return None
+    return str(payload["sub"])
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    Sıkıştırılmış her temsil kendi strong ETag'ini alır (byte'ları farklıdır)
+    """
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    # If-None-Match weak karşılaştırma kullanır
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or if_none_match.strip() == "*"
+
+
+class CachedRoute(APIRoute):
+    """
+    cache_response ile işaretlenmiş GET endpoint'lerini dependency çözümünden önce cache'ten yanıtlar.
+    cache_guard ile işaretlenmiş route dependency'leri cache isabetlerinde de çalışır.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        options = getattr(self.endpoint, "__response_cache__", None)
+        if options is None:
+            return handler
+
+        cache_control = "private, no-cache" if options.per_user else "public, no-cache"
+        guards = [
+            depends.dependency for depends in self.dependencies
+            if getattr(depends.dependency, "__cache_guard__", False)
+        ]
+
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+
+            principal = None
+            if options.per_user:
+                # Geçersiz token'lar normal akışa bırakılır (401 orada üretilir)
+                principal = _principal_from_request(request)
+                if principal is None:
+                    return await handler(request)
+
+            version = get_version(options.entity, principal or "*")
+            key = (self.path, request.url.path, request.url.query, principal, version)
+
+            entry = response_cache.get(key)
+            if entry is None:
+                response = await handler(request)
+                body = getattr(response, "body", None)
+                if response.status_code != 200 or body is None or response.background is not None:
+                    return response
+                etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+                entry = CacheEntry(body, response.media_type or "application/json", etag)
+                response_cache.set(key, entry)
+                return respond(request, key, entry)
+
+            async with AsyncExitStack() as stack:
+                for guard in guards:
+                    await stack.enter_async_context(_run_guard(guard, request))
+                return respond(request, key, entry)
+
+        def respond(request: Request, key, entry: CacheEntry) -> Response:
+            encoding = None
+            if len(entry.body) >= settings.COMPRESSION_MIN_SIZE:
+                encoding = choose_encoding(request.headers.get("accept-encoding"))
+            etag = variant_etag(entry.etag, encoding)
+
+            headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+            if etag_matches(request, etag):
+                response_cache.not_modified += 1
+                return Response(status_code=304, headers=headers)
+
+            if encoding is None:
+                return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+            headers["Content-Encoding"] = encoding
+            return Response(
+                content=response_cache.get_encoded(key, entry, encoding),
+                media_type=entry.media_type,
+                headers=headers,
+            )
+
+        return cached_handler
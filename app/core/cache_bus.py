@@ -0,0 +1,127 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from core import autocomplete
+from core.cache import bump_version, response_cache
+from core.config import settings
+from db.notify import listen, notify
+from db.session import mark_user_write
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+# Session.info anahtarı: commit'i bekleyen yerel geçersiz kılmalar
+PENDING_KEY = "cache_invalidations"
+
+_subscribers = defaultdict(list)
+_flush_callbacks = []
+_stop = threading.Event()
+_thread = None
+
+
+def subscribe(entity: str, callback: Callable[[str], None]) -> None:
+    """
+    Varlık geçersiz kılındığında çağrılacak callback'i kaydeder (callback key alır)
+    """
+    _subscribers[entity].append(callback)
+
+
+def on_flush(callback: Callable[[], None]) -> None:
+    """
+    Bus bağlantısı yeniden kurulduğunda (mesaj kaçırılmış olabilir) çağrılacak callback'i kaydeder
+    """
+    _flush_callbacks.append(callback)
+
+
+def _apply(entity: str, key: str) -> None:
+    bump_version(entity, key)
+    for callback in _subscribers.get(entity, ()):
+        callback(key)
+
+
+def publish(db: Session, entity: str, key="*") -> None:
+    """
+    Yazma ile aynı transaction'da, commit'ten önce çağrılır. Yerel cache transaction commit
+    edildiğinde geçersiz kılınır (rollback olursa hiç dokunulmaz); diğer worker'lara giden NOTIFY
+    de commit ile birlikte iletilir.
+    """
+    key = str(key)
+    # Bekleyen geçersiz kılma bu transaction'a aittir; transaction henüz başlamadıysa başlat
+    db.connection()
+    db.info.setdefault(PENDING_KEY, set()).add((entity, key))
+    if settings.CACHE_BUS_ENABLED:
+        notify(db, CHANNEL, {"entity": entity, "key": key})
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for entity, key in session.info.pop(PENDING_KEY, ()):
+        _apply(entity, key)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    # Savepoint rollback'lerinde dış transaction devam eder; yalnızca tamamı geri alınınca at
+    if not session.in_transaction():
+        session.info.pop(PENDING_KEY, None)
+
+
+def _on_message(channel: str, payload: str) -> None:
+    message = json.loads(payload)
+    _apply(message["entity"], message["key"])
+
+
+def flush_all() -> None:
+    """
+    Tüm yerel cache'leri boşaltır
+    """
+    response_cache.clear()
+    for callback in _flush_callbacks:
+        callback()
+    logger.info("Local caches flushed")
+
+
+def start() -> None:
+    """
+    Worker başına tek bir dinleme bağlantısı açan thread'i başlatır
+    """
+    global _thread
+    if not settings.CACHE_BUS_ENABLED or _thread is not None:
+        return
+    _stop.clear()
+    _thread = threading.Thread(
+        target=listen,
+        args=([CHANNEL], _on_message, _stop),
+        kwargs={"on_connect": flush_all},
+        name="cache-bus",
+        daemon=True,
+    )
+    _thread.start()
+
+
+def stop() -> None:
+    global _thread
+    _stop.set()
+    if _thread is not None:
+        _thread.join(timeout=10)
+        _thread = None
+
+
+def _on_word_change(key: str) -> None:
+    autocomplete.invalidate(None if key == "*" else int(key))
+
+
+def _on_user_change(key: str) -> None:
+    # Diğer worker'larda da read-your-writes için kullanıcıyı primary'ye yönlendir
+    if key != "*":
+        mark_user_write(int(key))
+
+
+# Varsayılan abonelikler
+subscribe("word", _on_word_change)
+subscribe("user", _on_user_change)
+on_flush(autocomplete.invalidate)
@@ -0,0 +1,162 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Optional
+from core.config import settings
+
+# Bulkhead adı -> (limit ayarı, latency hedefi ayarı)
+BULKHEADS = {
+    "auth": ("CONCURRENCY_AUTH_LIMIT", "CONCURRENCY_AUTH_TARGET_MS"),
+    "read": ("CONCURRENCY_READ_LIMIT", "CONCURRENCY_READ_TARGET_MS"),
+    "write": ("CONCURRENCY_WRITE_LIMIT", "CONCURRENCY_WRITE_TARGET_MS"),
+    "admin": ("CONCURRENCY_ADMIN_LIMIT", "CONCURRENCY_ADMIN_TARGET_MS"),
+    # Süresi istemcinin indirme hızına bağlı yanıtlar: sabit limit, latency'ye göre ayarlanmaz
+    "download": ("CONCURRENCY_DOWNLOAD_LIMIT", None),
+    # Süresi alt istek sayısına bağlı: sabit limit
+    "batch": ("CONCURRENCY_BATCH_LIMIT", None),
+}
+
+
+class AdaptiveLimiter:
+    """
+    AIMD adaptif eşzamanlılık limiti: gecikme hedefin altındayken ve limit doluyken limit yavaşça
+    artar, hedefin üstüne çıkınca çarpanla düşer. Limit doluyken istekler sınırlı bir kuyrukta
+    en fazla queue_timeout kadar bekler. target_ms verilmezse limit sabit kalır.
+    Event loop içinde kullanılır (thread-safe değildir).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        target_ms: Optional[float],
+        min_limit: int = 1,
+        max_queue: int = 50,
+        queue_timeout: float = 1.0,
+        backoff: float = 0.9,
+    ):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.target_ms = target_ms
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.backoff = backoff
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.latency_ms = None
+        self._waiters = deque()
+        self._last_decrease = 0.0
+        self.accepted = 0
+        self.queued = 0
+        self.shed = 0
+        self.timed_out = 0
+
+    async def acquire(self) -> bool:
+        """
+        Slot alır; kuyruk doluysa veya bekleme süresi dolarsa False döner
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.accepted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        timeout = loop.call_later(self.queue_timeout, self._expire, waiter)
+        try:
+            granted = await waiter
+        except asyncio.CancelledError:
+            # İstemci beklerken gitti; slot devredilmişse geri ver
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        finally:
+            timeout.cancel()
+
+        if granted:
+            self.accepted += 1
+        else:
+            self.timed_out += 1
+        return granted
+
+    def _expire(self, waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.set_result(False)
+
+    def release(self, latency: Optional[float] = None) -> None:
+        self.in_flight -= 1
+        if latency is not None:
+            self._adjust(latency)
+        # Boşalan slotları sıradaki bekleyenlere devret
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+    def _adjust(self, latency: float) -> None:
+        latency_ms = latency * 1000
+        self.latency_ms = latency_ms if self.latency_ms is None else 0.9 * self.latency_ms + 0.1 * latency_ms
+        if self.target_ms is None:
+            return
+        if latency_ms > self.target_ms:
+            # Aynı yük dalgasındaki her yavaş istek limiti ayrı ayrı düşürmesin
+            now = time.monotonic()
+            if now - self._last_decrease >= latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        elif self.in_flight + 1 >= int(self.limit) or self._waiters:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def retry_after(self) -> int:
+        latency = (self.latency_ms or self.target_ms or 1000) / 1000
+        return max(1, math.ceil(latency * (len(self._waiters) + 1) / max(1, int(self.limit))))
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queue_length": len(self._waiters),
+            "max_queue": self.max_queue,
+            "accepted": self.accepted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+            "latency_ms": round(self.latency_ms, 2) if self.latency_ms is not None else None,
+            "target_ms": self.target_ms,
+        }
+
+
+_limiters = {}
+
+
+def get_limiter(name: str) -> AdaptiveLimiter:
+    """
+    Bulkhead için limiter'ı döner (ilk çağrıda ayarlardan oluşturulur)
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limit_setting, target_setting = BULKHEADS[name]
+        limiter = _limiters[name] = AdaptiveLimiter(
+            name,
+            max_limit=getattr(settings, limit_setting),
+            target_ms=getattr(settings, target_setting) if target_setting else None,
+            max_queue=settings.CONCURRENCY_MAX_QUEUE,
+            queue_timeout=settings.CONCURRENCY_QUEUE_TIMEOUT_MS / 1000,
+        )
+    return limiter
+
+
+def stats() -> dict:
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -6,6 +6,12 @@ class Settings(BaseSettings):
     DB_HOST: str = "db"
     DB_PORT: int = 5432
     DB_NAME: str
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy derlenmiş sorgu cache boyutu (engine başına)
+
+    # Read Replicas (virgülle ayrılmış SQLAlchemy URL'leri)
+    DB_READ_REPLICA_URLS: str = ""
+    DB_READ_STICKY_SECONDS: int = 5  # Yazma sonrası kullanıcının primary'den okuma süresi
+    DB_REPLICA_RETRY_SECONDS: int = 30  # Sağlıksız replica'nın tekrar denenme süresi
 
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
@@ -29,6 +35,93 @@ class Settings(BaseSettings):
     # Test Key
     TEST_KEY: str
 
+    # Response Cache
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_MAX_VERSIONS: int = 100_000  # Tutulan (entity, key) versiyon sayısı
+
+    # Batch API
+    BATCH_MAX_REQUESTS: int = 20
+
+    # Word Autocomplete (process içi prefix index)
+    AUTOCOMPLETE_ENABLED: bool = True
+    AUTOCOMPLETE_TTL_SECONDS: int = 600
+
+    # Offline Vocabulary Packs
+    VOCAB_PACK_DIR: str = "data/vocab_packs"
+    VOCAB_PACK_KEEP_VERSIONS: int = 5  # Delta üretilebilecek eski versiyon sayısı
+
+    # User Data Export
+    EXPORT_DIR: str = "data/exports"  # Job ile üretilen export arşivleri
+    EXPORT_RETENTION_HOURS: int = 24  # Bu süreden eski export arşivleri silinir
+
+    # Word Catalog (worker'lar arasında mmap ile paylaşılan cevap kataloğu)
+    WORD_CATALOG_ENABLED: bool = True
+    WORD_CATALOG_DIR: str = "data/word_catalog"
+    WORD_CATALOG_CHECK_SECONDS: int = 2  # Dosyanın yeniden derlenip derlenmediği kontrol aralığı
+
+    # Offline Sync
+    SYNC_MAX_ATTEMPTS: int = 5000  # Tek yüklemede kabul edilen deneme sayısı
+
+    # Background Jobs
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_POLL_SECONDS: int = 5  # NOTIFY gelmese bile kuyruğun kontrol edilme aralığı
+    JOB_RETRY_BASE_SECONDS: int = 5  # Üstel backoff başlangıcı
+    JOB_LEASE_SECONDS: int = 60  # Heartbeat'i bu süre yenilenmeyen running job'lar tekrar kuyruğa alınır
+    JOB_HEARTBEAT_SECONDS: int = 15  # Çalışan job'ın lease'inin yenilenme aralığı
+
+    # Cross-worker cache invalidation (Postgres LISTEN/NOTIFY)
+    CACHE_BUS_ENABLED: bool = True
+
+    # Response Compression
+    COMPRESSION_MIN_SIZE: int = 1024  # Bu boyutun altındaki yanıtlar sıkıştırılmaz
+    # Seviyeler scripts/bench_compression.py ölçümlerindeki dirsek noktaları; üstü oranı az artırıp CPU'yu katlar
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Word Difficulty Model
+    DIFFICULTY_EPOCHS: int = 3  # word_attempts üzerinden geçiş sayısı
+    DIFFICULTY_LEARNING_RATE: float = 0.5
+    DIFFICULTY_CHUNK_BYTES: int = 16 * 1024 * 1024  # COPY mini-batch boyutu
+
+    # WebSocket Quiz
+    QUIZ_MAX_QUESTIONS: int = 50
+    QUIZ_CHECKPOINT_ANSWERS: int = 10  # Bu kadar cevapta bir denemeler kaydedilir
+    QUIZ_CHECKPOINT_SECONDS: int = 30  # veya bu kadar saniyede bir
+
+    # Request Profiler (superadmin)
+    PROFILER_SAMPLE_INTERVAL_MS: int = 5
+    PROFILER_MAX_SECONDS: int = 30  # Capture başına örnekleme süresi üst sınırı
+    PROFILER_MAX_STACKS: int = 5000  # Capture başına tutulan farklı stack sayısı
+    PROFILER_MAX_SQL: int = 500  # Capture başına tutulan farklı SQL sayısı
+    PROFILER_KEEP_CAPTURES: int = 10
+
+    # Concurrency Limits (bulkhead başına adaptif limit, latency hedefi ms)
+    CONCURRENCY_ENABLED: bool = True
+    CONCURRENCY_MAX_QUEUE: int = 50  # Bulkhead başına bekleyebilecek istek
+    CONCURRENCY_QUEUE_TIMEOUT_MS: int = 1000  # Kuyrukta bekleme süresi üst sınırı
+    CONCURRENCY_AUTH_LIMIT: int = 8  # bcrypt CPU'ya bağlı
+    CONCURRENCY_AUTH_TARGET_MS: int = 1000
+    CONCURRENCY_READ_LIMIT: int = 40
+    CONCURRENCY_READ_TARGET_MS: int = 250
+    CONCURRENCY_WRITE_LIMIT: int = 20
+    CONCURRENCY_WRITE_TARGET_MS: int = 500
+    CONCURRENCY_ADMIN_LIMIT: int = 4
+    CONCURRENCY_ADMIN_TARGET_MS: int = 2000
+    CONCURRENCY_DOWNLOAD_LIMIT: int = 20  # Export ve paket indirmeleri (sabit limit)
+    CONCURRENCY_BATCH_LIMIT: int = 10  # Aynı anda işlenen /batch istekleri (sabit limit)
+
+    # Rate Limiting
+    RATE_LIMIT_BACKEND: str = "memory"  # memory, redis
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_REDIS_TIMEOUT_MS: int = 100
+    RATE_LIMIT_FAIL_OPEN: bool = True  # Redis erişilemezken istekleri geçir (False: 429 döner)
+    RATE_LIMIT_TRUST_FORWARDED: bool = False  # X-Forwarded-For başlığına güven
+    RATE_LIMIT_IP_CAPACITY: int = 20  # IP başına anlık izin verilen istek
+    RATE_LIMIT_IP_REFILL_PER_SECOND: float = 1.0
+    RATE_LIMIT_EMAIL_CAPACITY: int = 5  # Email başına anlık izin verilen deneme
+    RATE_LIMIT_EMAIL_REFILL_PER_SECOND: float = 0.1
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
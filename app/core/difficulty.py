@@ -0,0 +1,206 @@
+import io
+import logging
+import time
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from core.config import settings
+from core.jobs import job_handler
+from db.models.user import User
+from db.models.word import Word
+
+logger = logging.getLogger(__name__)
+
+# Boşlukla ayrılmış text formatı: numpy tek geçişte (C tarafında) parse eder
+COPY_ATTEMPTS_SQL = (
+    "COPY (SELECT user_id, word_id, is_correct::int, COALESCE(response_time, -1) FROM word_attempts) "
+    "TO STDOUT WITH (FORMAT text, DELIMITER ' ')"
+)
+COLUMNS = 4
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    COPY çıktısını satır sınırlarında bölüp sabit boyutlu NumPy parçalarına çevirir (sınırlı bellek)
+    """
+
+    def __init__(self, on_chunk, chunk_bytes: int):
+        self._on_chunk = on_chunk
+        self._chunk_bytes = chunk_bytes
+        self._parts = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if isinstance(data, str):
+            data = data.encode()
+        self._parts.append(bytes(data))
+        self._size += len(data)
+        if self._size >= self._chunk_bytes:
+            self._flush(final=False)
+        return len(data)
+
+    def _flush(self, final: bool):
+        buffer = b"".join(self._parts)
+        cut = len(buffer) if final else buffer.rfind(b"\n") + 1
+        self._parts = [buffer[cut:]] if cut < len(buffer) else []
+        self._size = len(buffer) - cut
+        if cut:
+            values = np.fromstring(buffer[:cut].decode(), dtype=np.int64, sep=" ")
+            self._on_chunk(values.reshape(-1, COLUMNS))
+
+    def finish(self):
+        self._flush(final=True)
+
+
+class DifficultyModel:
+    """
+    Rasch (1PL IRT) modeli: P(doğru) = sigmoid(ability[user] - difficulty[word]).
+    Her COPY parçası bir mini-batch'tir; gradyanlar np.bincount ile vektörel toplanır.
+    """
+
+    def __init__(self, max_user_id: int, max_word_id: int, learning_rate: float, l2: float = 0.01):
+        self.ability = np.zeros(max_user_id + 1)
+        self.difficulty = np.zeros(max_word_id + 1)
+        self.user_attempts = np.zeros(max_user_id + 1, dtype=np.int64)
+        self.word_attempts = np.zeros(max_word_id + 1, dtype=np.int64)
+        self.word_correct = np.zeros(max_word_id + 1, dtype=np.int64)
+        self.word_time_sum = np.zeros(max_word_id + 1)
+        self.word_time_count = np.zeros(max_word_id + 1, dtype=np.int64)
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.rows = 0
+
+    def count(self, chunk: np.ndarray):
+        users, words, correct, response_time = chunk.T
+        self.user_attempts += np.bincount(users, minlength=len(self.ability))
+        self.word_attempts += np.bincount(words, minlength=len(self.difficulty))
+        self.word_correct += np.bincount(words, weights=correct, minlength=len(self.difficulty)).astype(np.int64)
+        timed = response_time >= 0
+        self.word_time_sum += np.bincount(words[timed], weights=response_time[timed], minlength=len(self.difficulty))
+        self.word_time_count += np.bincount(words[timed], minlength=len(self.difficulty))
+        self.rows += len(chunk)
+
+    def step(self, chunk: np.ndarray):
+        users, words, correct = chunk[:, 0], chunk[:, 1], chunk[:, 2]
+        predicted = 1.0 / (1.0 + np.exp(self.difficulty[words] - self.ability[users]))
+        residual = correct - predicted
+
+        user_grad = np.bincount(users, weights=residual, minlength=len(self.ability))
+        user_n = np.bincount(users, minlength=len(self.ability))
+        word_grad = np.bincount(words, weights=residual, minlength=len(self.difficulty))
+        word_n = np.bincount(words, minlength=len(self.difficulty))
+
+        self.ability += self.learning_rate * (user_grad / np.maximum(user_n, 1) - self.l2 * self.ability * (user_n > 0))
+        self.difficulty -= self.learning_rate * (word_grad / np.maximum(word_n, 1) + self.l2 * self.difficulty * (word_n > 0))
+
+    def normalize(self):
+        # Ölçeği ortalama kelime zorluğu 0 olacak şekilde sabitle (ability - difficulty değişmez)
+        seen = self.word_attempts > 0
+        if seen.any():
+            shift = self.difficulty[seen].mean()
+            self.difficulty -= shift
+            self.ability -= shift
+
+
+def _copy_attempts(db: Session, model: DifficultyModel, on_chunk) -> None:
+    def on_valid_chunk(chunk: np.ndarray):
+        # Fit sırasında eklenen kullanıcı/kelimeler dizilerin dışında kalır, sonraki çalıştırmaya bırakılır
+        valid = (chunk[:, 0] < len(model.ability)) & (chunk[:, 1] < len(model.difficulty))
+        on_chunk(chunk if valid.all() else chunk[valid])
+
+    sink = _ChunkSink(on_valid_chunk, settings.DIFFICULTY_CHUNK_BYTES)
+    dbapi_connection = db.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(COPY_ATTEMPTS_SQL, sink)
+    sink.finish()
+
+
+def _bulk_upsert(db: Session, table: str, columns: list, rows, conflict_column: str) -> int:
+    """
+    Sonuçları COPY ile geçici tabloya yükleyip tek INSERT ... ON CONFLICT ile yazar
+    """
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write("\t".join("\\N" if value is None else repr(value) for value in row))
+        buffer.write("\n")
+        count += 1
+    buffer.seek(0)
+
+    column_list = ", ".join(columns)
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns if column != conflict_column)
+    dbapi_connection = db.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.execute(f"CREATE TEMP TABLE tmp_{table} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY tmp_{table} ({column_list}) FROM STDIN", buffer)
+        cursor.execute(
+            f"INSERT INTO {table} ({column_list}, updated_at) "
+            f"SELECT {column_list}, now() FROM tmp_{table} "
+            f"ON CONFLICT ({conflict_column}) DO UPDATE SET {updates}, updated_at = now()"
+        )
+    return count
+
+
+def fit_difficulty(db: Session, epochs: int = None) -> dict:
+    """
+    Tüm kelime denemelerinden kelime zorluğu ve kullanıcı yeteneğini hesaplayıp word_stats/user_abilities'e yazar
+    """
+    epochs = epochs or settings.DIFFICULTY_EPOCHS
+    started = time.perf_counter()
+    max_user_id = db.execute(select(func.coalesce(func.max(User.id), 0))).scalar()
+    max_word_id = db.execute(select(func.coalesce(func.max(Word.id), 0))).scalar()
+    model = DifficultyModel(max_user_id, max_word_id, settings.DIFFICULTY_LEARNING_RATE)
+
+    for epoch in range(epochs):
+        if epoch == 0:
+            _copy_attempts(db, model, lambda chunk: (model.count(chunk), model.step(chunk)))
+        else:
+            _copy_attempts(db, model, model.step)
+    model.normalize()
+
+    word_ids = np.flatnonzero(model.word_attempts)
+    user_ids = np.flatnonzero(model.user_attempts)
+    avg_time = np.divide(
+        model.word_time_sum, model.word_time_count,
+        out=np.full(len(model.difficulty), np.nan), where=model.word_time_count > 0,
+    )
+
+    words_written = _bulk_upsert(
+        db, "word_stats", ["word_id", "difficulty", "attempts", "correct", "avg_response_time"],
+        (
+            (
+                int(word_id), float(model.difficulty[word_id]), int(model.word_attempts[word_id]),
+                int(model.word_correct[word_id]),
+                None if np.isnan(avg_time[word_id]) else float(avg_time[word_id]),
+            )
+            for word_id in word_ids
+        ),
+        "word_id",
+    )
+    users_written = _bulk_upsert(
+        db, "user_abilities", ["user_id", "ability", "attempts"],
+        (
+            (int(user_id), float(model.ability[user_id]), int(model.user_attempts[user_id]))
+            for user_id in user_ids
+        ),
+        "user_id",
+    )
+    db.commit()
+
+    result = {
+        "attempts": model.rows,
+        "words": words_written,
+        "users": users_written,
+        "epochs": epochs,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info("Difficulty fit finished: %s", result)
+    return result
+
+
+@job_handler("difficulty.fit")
+def fit_difficulty_job(db: Session, payload: dict) -> None:
+    fit_difficulty(db, epochs=payload.get("epochs"))
@@ -0,0 +1,243 @@
+import io
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from core.config import settings
+from core.jobs import job_handler
+from db.models.user import User
+from db.models.user_progress import UserProgress
+from db.session import engine
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BYTES = 256 * 1024
+
+EXPORT_FILE_NAME = re.compile(r"^user-(\d+)-(\d{14})-([0-9a-f]{8})\.zip$")
+
+ATTEMPTS_COPY_SQL = (
+    "COPY (SELECT id, word_id, user_answer, is_correct, response_time, attempted_at, client_id "
+    "FROM word_attempts WHERE user_id = %s ORDER BY id) TO STDOUT WITH (FORMAT csv, HEADER)"
+)
+
+
+class _ZipStream(io.RawIOBase):
+    """
+    ZipFile'ın yazdığı byte'ları toplayan, seek desteklemeyen çıktı (zip data descriptor modunda yazar)
+    """
+
+    def __init__(self):
+        self._parts = []
+        self.size = 0
+        self.total = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self.size += len(data)
+        self.total += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        self.size = 0
+        return data
+
+
+class _QueueWriter(io.RawIOBase):
+    """
+    COPY çıktısını sınırlı bir kuyruğa aktarır (tüketici yavaşsa COPY bekler)
+    """
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        while True:
+            if self._cancelled.is_set():
+                raise IOError("Export cancelled")
+            try:
+                self._chunks.put(bytes(data), timeout=1)
+                return len(data)
+            except queue.Full:
+                continue
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def iter_user_export(user_id: int) -> Iterator[bytes]:
+    """
+    Kullanıcının profil, ilerleme ve deneme verilerini sabit bellekle ZIP olarak parça parça üretir
+    """
+    started = time.perf_counter()
+    stream = _ZipStream()
+
+    with engine.connect() as connection:
+        with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            # Profil
+            user = connection.execute(
+                select(User.__table__).where(User.id == user_id)
+            ).mappings().first()
+            profile = {key: value for key, value in (user or {}).items() if key != "hashed_password"}
+            archive.writestr("profile.json", json.dumps(profile, default=_json_default, ensure_ascii=False, indent=2))
+            yield stream.drain()
+
+            # İlerleme: server-side cursor ile satır satır
+            with archive.open("progress.ndjson", "w", force_zip64=True) as entry:
+                rows = connection.execution_options(stream_results=True, yield_per=1000).execute(
+                    select(UserProgress.__table__).where(UserProgress.user_id == user_id).order_by(UserProgress.id)
+                )
+                for row in rows.mappings():
+                    entry.write(json.dumps(dict(row), default=_json_default, ensure_ascii=False).encode() + b"\n")
+                    if stream.size >= FLUSH_BYTES:
+                        yield stream.drain()
+            yield stream.drain()
+
+            # Denemeler: COPY ... TO STDOUT ayrı thread'de, sınırlı kuyrukla
+            with archive.open("word_attempts.csv", "w", force_zip64=True) as entry:
+                yield from _copy_attempts_into(connection, user_id, entry, stream)
+        yield stream.drain()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "User %s export: %d bytes in %.2fs (%.0f bytes/sec)",
+        user_id, stream.total, elapsed, stream.total / elapsed if elapsed else 0,
+    )
+
+
+def _copy_attempts_into(connection, user_id: int, entry, stream: _ZipStream) -> Iterator[bytes]:
+    chunks = queue.Queue(maxsize=16)
+    cancelled = threading.Event()
+    errors = []
+    dbapi_connection = connection.connection.driver_connection
+
+    def run_copy():
+        try:
+            with dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(cursor.mogrify(ATTEMPTS_COPY_SQL, (user_id,)).decode(), _QueueWriter(chunks, cancelled))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            while True:
+                try:
+                    chunks.put(None, timeout=1)
+                    break
+                except queue.Full:
+                    if cancelled.is_set():
+                        break
+
+    thread = threading.Thread(target=run_copy, daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            entry.write(chunk)
+            if stream.size >= FLUSH_BYTES:
+                yield stream.drain()
+    finally:
+        # İstemci bağlantıyı kapattıysa COPY'yi durdur
+        cancelled.set()
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def write_user_export(user_id: int) -> str:
+    """
+    Export arşivini EXPORT_DIR altına yazar ve dosya yolunu döner
+    """
+    os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+    cleanup_exports()
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    # Aynı saniyede başlayan iki job aynı .part dosyasına yazmasın
+    path = os.path.join(settings.EXPORT_DIR, f"user-{user_id}-{timestamp}-{uuid.uuid4().hex[:8]}.zip")
+    with open(path + ".part", "wb") as f:
+        for chunk in iter_user_export(user_id):
+            f.write(chunk)
+    os.replace(path + ".part", path)
+    return path
+
+
+def list_user_exports(user_id: int) -> List[dict]:
+    """
+    Kullanıcının hazır export arşivlerini en yeniden eskiye listeler
+    """
+    try:
+        names = os.listdir(settings.EXPORT_DIR)
+    except FileNotFoundError:
+        return []
+    exports = []
+    for name in names:
+        match = EXPORT_FILE_NAME.match(name)
+        if match is None or int(match.group(1)) != user_id:
+            continue
+        stat = os.stat(os.path.join(settings.EXPORT_DIR, name))
+        exports.append({
+            "file_name": name,
+            "size": stat.st_size,
+            "created_at": datetime.strptime(match.group(2), "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc),
+        })
+    return sorted(exports, key=lambda export: export["file_name"], reverse=True)
+
+
+def user_export_path(user_id: int, file_name: str) -> Optional[str]:
+    """
+    Dosya kullanıcıya aitse ve hâlâ duruyorsa yolunu döner (dosya adı dışında yol kabul edilmez)
+    """
+    match = EXPORT_FILE_NAME.match(file_name)
+    if match is None or int(match.group(1)) != user_id:
+        return None
+    path = os.path.join(settings.EXPORT_DIR, file_name)
+    return path if os.path.isfile(path) else None
+
+
+def cleanup_exports() -> int:
+    """
+    Saklama süresi dolan export arşivlerini ve yarım kalmış .part dosyalarını siler
+    """
+    deadline = time.time() - settings.EXPORT_RETENTION_HOURS * 3600
+    removed = 0
+    try:
+        names = os.listdir(settings.EXPORT_DIR)
+    except FileNotFoundError:
+        return 0
+    for name in names:
+        if not (EXPORT_FILE_NAME.match(name) or name.endswith(".zip.part")):
+            continue
+        path = os.path.join(settings.EXPORT_DIR, name)
+        try:
+            if os.stat(path).st_mtime < deadline:
+                os.unlink(path)
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+@job_handler("user.export")
+def user_export_job(db: Session, payload: dict) -> None:
+    write_user_export(payload["user_id"])
@@ -0,0 +1,20 @@
+import unicodedata
+
+# Türkçe noktasız ı, aksanı atılmış i ile eşleşsin
+_DOTLESS_I = str.maketrans({"ı": "i"})
+
+
+def normalize_answer(value: str) -> str:
+    """
+    Cevabı karşılaştırma için normalize eder (büyük/küçük harf, boşluk ve aksan farkları yok sayılır)
+    """
+    value = unicodedata.normalize("NFKD", (value or "").translate(_DOTLESS_I).casefold())
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return " ".join(value.split())
+
+
+def is_correct_answer(expected: str, answer: str) -> bool:
+    """
+    Kullanıcı cevabının beklenen çeviriyle eşleşip eşleşmediğini kontrol eder
+    """
+    return normalize_answer(expected) == normalize_answer(answer)
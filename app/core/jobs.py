@@ -0,0 +1,279 @@
+import importlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from core.config import settings
+from db.models.job import Job
+from db.notify import notify
+from db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+JOB_CHANNEL = "jobs"
+
+# Handler'larını job_handler ile kaydeden modüller (worker ve admin endpoint'leri yükler)
+HANDLER_MODULES = [
+    "core.vocab_pack",
+    "core.difficulty",
+    "core.export",
+    "core.word_catalog",
+]
+
+_handlers = {}
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def job_handler(job_type: str) -> Callable:
+    """
+    Fonksiyonu verilen job tipinin handler'ı olarak kaydeder. Handler (db, payload) alır.
+    """
+    def decorator(func: Callable) -> Callable:
+        _handlers[job_type] = func
+        return func
+    return decorator
+
+
+def load_handlers() -> dict:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+    return _handlers
+
+
+def enqueue(
+    db: Session,
+    job_type: str,
+    payload: Optional[dict] = None,
+    delay_seconds: int = 0,
+    max_attempts: int = 5,
+) -> Job:
+    """
+    Yeni job ekler ve worker'ları NOTIFY ile uyandırır.
+    Commit etmez: job ve bildirim çağıranın transaction'ı commit edilince görünür olur.
+    """
+    job = Job(
+        type=job_type,
+        payload=payload or {},
+        status="queued",
+        max_attempts=max_attempts,
+        run_at=datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+    )
+    db.add(job)
+    db.flush()
+    notify(db, JOB_CHANNEL, job_type)
+    return job
+
+
+def find_pending(db: Session, job_type: str, **payload) -> Optional[Job]:
+    """
+    Verilen tipte, payload alanları eşleşen ve kuyrukta bekleyen ya da çalışan job'ı döner
+    """
+    stmt = select(Job).where(Job.type == job_type, Job.status.in_(("queued", "running")))
+    for key, value in payload.items():
+        stmt = stmt.where(Job.payload[key].as_string() == str(value))
+    return db.execute(stmt.order_by(Job.id).limit(1)).scalar()
+
+
+def enqueue_unique(db: Session, job_type: str, payload: dict, **kwargs) -> tuple:
+    """
+    Aynı tip ve payload ile bekleyen/çalışan job varsa onu, yoksa yeni eklenen job'ı döner: (job, created).
+    Eşzamanlı iki istek aynı job'ı iki kez eklemesin diye kontrol transaction advisory lock'u altında yapılır.
+    Commit etmez.
+    """
+    db.execute(select(func.pg_advisory_xact_lock(
+        func.hashtext(job_type), func.hashtext(json.dumps(payload, sort_keys=True))
+    )))
+    job = find_pending(db, job_type, **payload)
+    if job is not None:
+        return job, False
+    return enqueue(db, job_type, payload, **kwargs), True
+
+
+def claim_job(db: Session) -> Optional[Job]:
+    """
+    Çalışmaya hazır ilk job'ı FOR UPDATE SKIP LOCKED ile alır ve running olarak işaretler
+    """
+    stmt = (
+        select(Job)
+        .where(Job.status == "queued", Job.run_at <= datetime.now(timezone.utc))
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = db.execute(stmt).scalar()
+    if job is None:
+        db.rollback()
+        return None
+    job.status = "running"
+    job.attempts += 1
+    job.started_at = datetime.now(timezone.utc)
+    job.lease_until = job.started_at + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    # Her claim'e özel token: lease'i düşüp başka worker'a geçen job'a eski sahibi yazamaz
+    job.locked_by = f"{WORKER_ID}:{uuid.uuid4().hex[:12]}"
+    db.commit()
+    return job
+
+
+def _owned(job_id: int, locked_by: str) -> tuple:
+    return Job.id == job_id, Job.status == "running", Job.locked_by == locked_by
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """
+    Worker'ı çöken (lease'i heartbeat ile yenilenmemiş) running job'ları tekrar kuyruğa alır;
+    deneme hakkı bitenleri failed olarak işaretler
+    """
+    now = datetime.now(timezone.utc)
+    expired = (Job.status == "running", Job.lease_until < now)
+    failed = db.execute(
+        update(Job)
+        .where(*expired, Job.attempts >= Job.max_attempts)
+        .values(
+            status="failed", finished_at=now, lease_until=None, locked_by=None,
+            last_error="Job lease expired (worker lost)",
+        )
+    )
+    requeued = db.execute(
+        update(Job)
+        .where(*expired, Job.attempts < Job.max_attempts)
+        .values(
+            status="queued", run_at=now, lease_until=None, locked_by=None,
+            last_error="Job lease expired (worker lost)",
+        )
+    )
+    db.commit()
+    return failed.rowcount + requeued.rowcount
+
+
+def renew_lease(db: Session, job_id: int, locked_by: str) -> bool:
+    """
+    Çalışan job'ın lease'ini uzatır; job artık bu claim'e ait değilse False döner
+    """
+    result = db.execute(
+        update(Job)
+        .where(*_owned(job_id, locked_by))
+        .values(lease_until=datetime.now(timezone.utc) + timedelta(seconds=settings.JOB_LEASE_SECONDS))
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
+class _Heartbeat:
+    """
+    Handler çalışırken ayrı bir session ile job'ın lease'ini düzenli yeniler
+    """
+
+    def __init__(self, job_id: int, locked_by: str):
+        self.job_id = job_id
+        self.locked_by = locked_by
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{job_id}", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(settings.JOB_HEARTBEAT_SECONDS):
+            db = SessionLocal()
+            try:
+                if not renew_lease(db, self.job_id, self.locked_by):
+                    logger.warning("Job %s lease lost", self.job_id)
+                    return
+            except Exception:
+                logger.warning("Job %s heartbeat failed", self.job_id, exc_info=True)
+            finally:
+                db.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def retry_delay(attempts: int) -> int:
+    return min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), 3600)
+
+
+class JobMetrics:
+    """
+    Job tipi başına process içi sayaçlar
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, job_type: str, outcome: str, duration: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                job_type,
+                {"succeeded": 0, "retried": 0, "failed": 0, "lost": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+            )
+            stats[outcome] += 1
+            stats["total_seconds"] += duration
+            stats["max_seconds"] = max(stats["max_seconds"], duration)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {job_type: dict(stats) for job_type, stats in self._stats.items()}
+
+
+metrics = JobMetrics()
+
+
+def run_job(db: Session, job: Job) -> str:
+    """
+    Job'ı çalıştırır; hata olursa backoff ile tekrar kuyruğa alır veya failed olarak işaretler.
+    Sonuç yalnızca job hâlâ bu claim'e aitse yazılır (lease düşüp job başka worker'a geçtiyse "lost").
+    """
+    started = time.perf_counter()
+    handler = _handlers.get(job.type)
+    # Handler session'ı commit/rollback edebilir; claim bilgileri önceden okunur
+    claim = {
+        "id": job.id, "type": job.type, "locked_by": job.locked_by,
+        "attempts": job.attempts, "max_attempts": job.max_attempts,
+    }
+    values = {}
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job type '{claim['type']}'")
+        with _Heartbeat(claim["id"], claim["locked_by"]):
+            handler(db, job.payload or {})
+        db.rollback()  # Handler'ın commit etmediği yarım işleri bırakma
+        values.update(status="done", last_error=None)
+        outcome = "succeeded"
+    except Exception:
+        db.rollback()
+        values["last_error"] = traceback.format_exc(limit=20)
+        if claim["attempts"] < claim["max_attempts"] and handler is not None:
+            values.update(
+                status="queued",
+                run_at=datetime.now(timezone.utc) + timedelta(seconds=retry_delay(claim["attempts"])),
+            )
+            outcome = "retried"
+        else:
+            values["status"] = "failed"
+            outcome = "failed"
+        logger.warning("Job %s (%s) %s", claim["id"], claim["type"], outcome, exc_info=True)
+
+    result = db.execute(
+        update(Job)
+        .where(*_owned(claim["id"], claim["locked_by"]))
+        .values(finished_at=datetime.now(timezone.utc), lease_until=None, locked_by=None, **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    if result.rowcount == 0:
+        logger.warning("Job %s (%s) lease lost before finishing, result not recorded", claim["id"], claim["type"])
+        outcome = "lost"
+    metrics.record(claim["type"], outcome, time.perf_counter() - started)
+    return outcome
@@ -0,0 +1,329 @@
+import contextvars
+import fnmatch
+import os
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import event
+from starlette.datastructures import Headers
+from core.config import settings
+from db.session import engine, replicas
+
+PROFILE_HEADER = "x-profile-token"
+MAX_STACK_DEPTH = 128
+MAX_SQL_LENGTH = 2000
+TRUNCATED_STACK = "[truncated]"
+
+# Boşta bekleyen thread'lerin en üst frame'i bu dosyalardadır; örneklere katılmazlar
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py")
+
+_current = contextvars.ContextVar("profile_capture", default=None)
+
+
+@lru_cache(maxsize=8192)
+def _frame_label(code) -> str:
+    filename = "/".join(code.co_filename.replace("\\", "/").split("/")[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _collapse(frame) -> Optional[str]:
+    if frame.f_code.co_filename.endswith(_IDLE_FILES):
+        return None
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class Capture:
+    """
+    Kurulu bir profil isteği: eşleşen sonraki N isteğin CPU örneklerini ve SQL'lerini toplar
+    """
+
+    def __init__(self, path: Optional[str], method: Optional[str], count: int, ttl_seconds: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.token = secrets.token_urlsafe(16)
+        self.path = path
+        self.method = method.upper() if method else None
+        self.requested = count
+        self.remaining = count
+        self.status = "armed"
+        self.created_at = datetime.now(timezone.utc)
+        self.expires_at = time.monotonic() + ttl_seconds
+        self.sampling_until = None
+        self.in_flight = 0
+        self.samples = 0
+        self.stacks = Counter()
+        self.sql = {}
+        self.requests = []
+
+    def matches(self, scope) -> bool:
+        path = scope["path"]
+        if "/profiler/" in path:
+            return False
+        if Headers(scope=scope).get(PROFILE_HEADER) == self.token:
+            return True
+        if self.path is None or not fnmatch.fnmatchcase(path, self.path):
+            return False
+        return self.method is None or scope["method"] == self.method
+
+    def add_samples(self, stacks: list) -> None:
+        if self.sampling_until is not None and time.monotonic() > self.sampling_until:
+            return
+        for stack in stacks:
+            if stack not in self.stacks and len(self.stacks) >= settings.PROFILER_MAX_STACKS:
+                stack = TRUNCATED_STACK
+            self.stacks[stack] += 1
+            self.samples += 1
+
+    def add_sql(self, statement: str, duration: float) -> None:
+        statement = " ".join(statement.split())[:MAX_SQL_LENGTH]
+        stats = self.sql.get(statement)
+        if stats is None:
+            if len(self.sql) >= settings.PROFILER_MAX_SQL:
+                return
+            stats = self.sql[statement] = {"statement": statement, "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        duration_ms = duration * 1000
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+
+    def collapsed(self) -> str:
+        """
+        flamegraph.pl / speedscope ile uyumlu collapsed-stack çıktısı
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def function_summary(self, limit: int = 50) -> list:
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        samples = self.samples or 1
+        return [
+            {
+                "function": function,
+                "self_samples": own[function],
+                "total_samples": count,
+                "self_percent": round(own[function] * 100 / samples, 2),
+                "total_percent": round(count * 100 / samples, 2),
+            }
+            for function, count in total.most_common(limit)
+        ]
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "token": self.token,
+            "path": self.path,
+            "method": self.method,
+            "status": self.status,
+            "requested": self.requested,
+            "remaining": self.remaining,
+            "created_at": self.created_at,
+            "samples": self.samples,
+            "requests": list(self.requests),
+        }
+
+
+class Profiler:
+    """
+    Aynı anda tek kurulu capture tutar. Kurulu capture yokken middleware yalnızca bir
+    attribute kontrolü yapar; örnekleme thread'i ve SQL listener'ları sadece profillenen
+    istek işlenirken çalışır. Capture'lar worker process'ine özeldir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.armed = None
+        self.captures = OrderedDict()
+        self._active = set()
+        self._stop = None
+
+    def arm(self, path: Optional[str], method: Optional[str], count: int, ttl_seconds: int) -> Optional[Capture]:
+        with self._lock:
+            self._expire()
+            if self.armed is not None:
+                return None
+            capture = Capture(path, method, count, ttl_seconds)
+            self.armed = capture
+            self.captures[capture.id] = capture
+            while len(self.captures) > settings.PROFILER_KEEP_CAPTURES:
+                oldest = next(iter(self.captures.values()))
+                if oldest is self.armed or oldest.in_flight:
+                    break
+                self.captures.popitem(last=False)
+            return capture
+
+    def cancel(self, capture_id: str) -> Optional[Capture]:
+        with self._lock:
+            capture = self.captures.get(capture_id)
+            if capture is not None and capture is self.armed:
+                self.armed = None
+                capture.remaining = 0
+                if capture.in_flight == 0:
+                    capture.status = "done" if capture.requests else "cancelled"
+            return capture
+
+    def list(self) -> list:
+        with self._lock:
+            self._expire()
+            return [capture.summary() for capture in reversed(self.captures.values())]
+
+    def report(self, capture_id: str, limit: int = 50) -> Optional[dict]:
+        with self._lock:
+            self._expire()
+            capture = self.captures.get(capture_id)
+            if capture is None:
+                return None
+            sql = sorted(capture.sql.values(), key=lambda stats: stats["total_ms"], reverse=True)
+            return {**capture.summary(), "functions": capture.function_summary(limit), "sql": [dict(stats) for stats in sql]}
+
+    def collapsed(self, capture_id: str) -> Optional[str]:
+        with self._lock:
+            capture = self.captures.get(capture_id)
+            return capture.collapsed() if capture is not None else None
+
+    def _expire(self) -> None:
+        capture = self.armed
+        if capture is not None and time.monotonic() > capture.expires_at:
+            self.armed = None
+            if capture.in_flight == 0:
+                capture.status = "done" if capture.requests else "expired"
+
+    def claim(self, scope) -> Optional[Capture]:
+        with self._lock:
+            self._expire()
+            capture = self.armed
+            if capture is None or not capture.matches(scope):
+                return None
+            capture.remaining -= 1
+            if capture.remaining <= 0:
+                self.armed = None
+            capture.status = "running"
+            capture.in_flight += 1
+            if capture.sampling_until is None:
+                capture.sampling_until = time.monotonic() + settings.PROFILER_MAX_SECONDS
+            if not self._active:
+                self._start()
+            self._active.add(capture)
+            return capture
+
+    def release(self, capture: Capture, request: dict) -> None:
+        with self._lock:
+            capture.in_flight -= 1
+            capture.requests.append(request)
+            if capture.in_flight == 0:
+                self._active.discard(capture)
+                capture.status = "armed" if capture is self.armed else "done"
+            if not self._active:
+                self._shutdown()
+
+    def _start(self) -> None:
+        for bind in [engine, *replicas.engines]:
+            event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+            event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+            event.listen(bind, "handle_error", _handle_error)
+        self._stop = threading.Event()
+        threading.Thread(
+            target=self._sample_loop, args=(self._stop,), name="profiler-sampler", daemon=True
+        ).start()
+
+    def _shutdown(self) -> None:
+        for bind in [engine, *replicas.engines]:
+            event.remove(bind, "before_cursor_execute", _before_cursor_execute)
+            event.remove(bind, "after_cursor_execute", _after_cursor_execute)
+            event.remove(bind, "handle_error", _handle_error)
+        self._stop.set()
+        self._stop = None
+
+    def _sample_loop(self, stop: threading.Event) -> None:
+        # Süreç genelinde örnekler: profillenen istekle eşzamanlı çalışan istekler de görünebilir
+        interval = settings.PROFILER_SAMPLE_INTERVAL_MS / 1000
+        own = threading.get_ident()
+        while not stop.wait(interval):
+            frames = sys._current_frames()
+            stacks = [_collapse(frame) for ident, frame in frames.items() if ident != own]
+            stacks = [stack for stack in stacks if stack]
+            del frames
+            with self._lock:
+                for capture in self._active:
+                    capture.add_samples(stacks)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    capture = _current.get()
+    started = conn.info.get("profile_started")
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    if capture is not None:
+        with profiler._lock:
+            capture.add_sql(statement, duration)
+
+
+def _handle_error(context):
+    # Hata veren sorguda after_cursor_execute çalışmaz; başlangıç zamanı bağlantıda birikmesin
+    started = context.connection.info.get("profile_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+profiler = Profiler()
+
+
+class ProfilerMiddleware:
+    """
+    Kurulu capture ile eşleşen istekleri profiller (path deseni veya X-Profile-Token başlığı)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if profiler.armed is None or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        capture = profiler.claim(scope)
+        if capture is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        token = _current.set(capture)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            profiler.release(capture, {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "pid": os.getpid(),
+            })
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryBucketBackend:
+    """
+    Tek worker için process içi token bucket deposu.
+    Bucket'lar son kullanım sırasıyla tutulur; doluyken en uzun süredir kullanılmayan atılır (O(1)).
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def consume(self, key: str, capacity: int, refill_per_second: float) -> Tuple[bool, float]:
+        """
+        Bucket'tan bir token harcar, (izin, tekrar deneme saniyesi) döner
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [float(capacity), now]
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True, 0.0
+
+            bucket[0] = tokens
+            return False, (1 - tokens) / refill_per_second
+
+
+# Redis tarafında atomik çalışan token bucket; saat farkı olan pod'lar aynı sonucu alsın diye
+# zaman Redis TIME komutundan okunur
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBucketBackend:
+    """
+    Birden fazla worker/pod arasında paylaşılan Redis uyumlu token bucket deposu
+    """
+
+    def __init__(self, url: str, fail_open: bool = True, timeout: float = 0.1):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis için 'redis' paketi kurulu olmalı")
+
+        self._errors = redis.RedisError
+        self._fail_open = fail_open
+        self._client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+
+    def consume(self, key: str, capacity: int, refill_per_second: float) -> Tuple[bool, float]:
+        try:
+            allowed, tokens = self._script(
+                keys=[f"ratelimit:{key}"],
+                args=[capacity, refill_per_second],
+            )
+        except self._errors:
+            # Redis erişilemezken auth istekleri 500 almasın; politika RATE_LIMIT_FAIL_OPEN ile seçilir
+            logger.warning("Rate limit backend unavailable, failing %s", "open" if self._fail_open else "closed", exc_info=True)
+            if self._fail_open:
+                return True, 0.0
+            return False, 1.0
+        if allowed:
+            return True, 0.0
+        return False, (1 - float(tokens)) / refill_per_second
+
+
+_backend = None
+
+
+def get_backend():
+    """
+    Ayarlara göre rate limit deposunu (lazy) oluşturur
+    """
+    global _backend
+    if _backend is None:
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            _backend = RedisBucketBackend(
+                settings.RATE_LIMIT_REDIS_URL,
+                fail_open=settings.RATE_LIMIT_FAIL_OPEN,
+                timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000,
+            )
+        else:
+            _backend = InMemoryBucketBackend()
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """
+    Rate limit deposunu değiştirir (testler ve özel depolar için)
+    """
+    global _backend
+    _backend = backend
+
+
+def consume(key: str, capacity: int, refill_per_second: float) -> Tuple[bool, float]:
+    """
+    Verilen anahtar için bir token harcar
+    """
+    return get_backend().consume(key, capacity, refill_per_second)
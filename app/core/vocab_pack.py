@@ -0,0 +1,281 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from core.cache import etag_matches
+from core.config import settings
+from core.jobs import job_handler
+from db.models.language import Language
+from db.models.language_level import LanguageLevel
+from db.models.word import Word
+
+PACK_MEDIA_TYPE = "application/gzip"
+CHUNK_SIZE = 64 * 1024
+CODE_PATTERN = re.compile(r"[A-Za-z0-9]{2}")
+VERSION_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+_build_lock = threading.Lock()
+
+
+def is_valid_code(code: str) -> bool:
+    return CODE_PATTERN.fullmatch(code) is not None
+
+
+def _pack_dir(language_code: str, level_code: str) -> str:
+    """
+    Paket dizini; kodlar doğrulanır ve çözülen yolun VOCAB_PACK_DIR altında kaldığı kontrol edilir
+    """
+    if not (is_valid_code(language_code) and is_valid_code(level_code)):
+        raise ValueError(f"Invalid pack codes: {language_code!r}, {level_code!r}")
+    root = os.path.realpath(settings.VOCAB_PACK_DIR)
+    directory = os.path.realpath(os.path.join(root, language_code.lower(), level_code.lower()))
+    if os.path.commonpath([root, directory]) != root:
+        raise ValueError(f"Pack directory escapes VOCAB_PACK_DIR: {directory}")
+    return directory
+
+
+def _check_version(version: str) -> str:
+    if VERSION_PATTERN.fullmatch(version) is None:
+        raise ValueError(f"Invalid pack version: {version!r}")
+    return version
+
+
+def pack_path(language_code: str, level_code: str, version: str) -> str:
+    return os.path.join(_pack_dir(language_code, level_code), f"{_check_version(version)}.json.gz")
+
+
+def delta_path(language_code: str, level_code: str, from_version: str, to_version: str) -> str:
+    return os.path.join(
+        _pack_dir(language_code, level_code),
+        f"delta-{_check_version(from_version)}-{_check_version(to_version)}.json.gz",
+    )
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_manifest(language_code: str, level_code: str) -> Optional[dict]:
+    try:
+        with open(os.path.join(_pack_dir(language_code, level_code), "manifest.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _is_stale(language_code: str, level_code: str) -> bool:
+    return os.path.exists(os.path.join(_pack_dir(language_code, level_code), "stale"))
+
+
+def _load_words(db: Session, language_code: str, level_code: str) -> list:
+    stmt = (
+        select(Word.id, Word.text, Word.translation, Word.pronunciation, Word.example_sentence)
+        .join(Language, Word.language_id == Language.id)
+        .join(LanguageLevel, Word.level_id == LanguageLevel.id)
+        .where(Language.code == language_code, LanguageLevel.code == level_code)
+        .order_by(Word.id)
+    )
+    return [list(row) for row in db.execute(stmt)]
+
+
+def _read_pack_words(language_code: str, level_code: str, version: str) -> dict:
+    with gzip.open(pack_path(language_code, level_code, version), "rb") as f:
+        return {row[0]: row for row in json.load(f)["words"]}
+
+
+def build_pack(db: Session, language_code: str, level_code: str) -> dict:
+    """
+    (dil, seviye) kelime setini sıkıştırılmış, versiyonlu pakete derler ve manifest'i günceller
+    """
+    words = _load_words(db, language_code, level_code)
+    encoded_words = json.dumps(words, ensure_ascii=False, separators=(",", ":")).encode()
+    version = hashlib.sha256(encoded_words).hexdigest()[:16]
+
+    with _build_lock:
+        manifest = read_manifest(language_code, level_code) or {"versions": []}
+        stale_marker = os.path.join(_pack_dir(language_code, level_code), "stale")
+
+        if manifest.get("version") != version:
+            body = json.dumps(
+                {"language": language_code, "level": level_code, "version": version, "words": words},
+                ensure_ascii=False, separators=(",", ":"),
+            ).encode()
+            _write_atomic(pack_path(language_code, level_code, version), gzip.compress(body, mtime=0))
+
+            versions = [v for v in manifest["versions"] if v != version] + [version]
+            for old_version in versions[:-settings.VOCAB_PACK_KEEP_VERSIONS]:
+                _remove_version(language_code, level_code, old_version)
+            manifest = {
+                "language": language_code,
+                "level": level_code,
+                "version": version,
+                "versions": versions[-settings.VOCAB_PACK_KEEP_VERSIONS:],
+                "word_count": len(words),
+                "size": os.path.getsize(pack_path(language_code, level_code, version)),
+                "built_at": int(time.time()),
+            }
+            _write_atomic(
+                os.path.join(_pack_dir(language_code, level_code), "manifest.json"),
+                json.dumps(manifest).encode(),
+            )
+
+        if os.path.exists(stale_marker):
+            os.unlink(stale_marker)
+    return manifest
+
+
+def _remove_version(language_code: str, level_code: str, version: str) -> None:
+    directory = _pack_dir(language_code, level_code)
+    for name in os.listdir(directory):
+        if name == f"{version}.json.gz" or (name.startswith("delta-") and version in name):
+            os.unlink(os.path.join(directory, name))
+
+
+def _codes_exist(db: Session, language_code: str, level_code: str) -> bool:
+    stmt = select(
+        exists().where(Language.code == language_code),
+        exists().where(LanguageLevel.code == level_code),
+    )
+    return all(db.execute(stmt).one())
+
+
+def ensure_pack(db: Session, language_code: str, level_code: str) -> Optional[dict]:
+    """
+    Güncel paketin manifest'ini döner, paket yoksa veya kelimeler değiştiyse yeniden derler.
+    Dil veya seviye yoksa dosya sistemine dokunmadan None döner.
+    """
+    if not (is_valid_code(language_code) and is_valid_code(level_code)):
+        return None
+    if not _codes_exist(db, language_code, level_code):
+        return None
+    manifest = read_manifest(language_code, level_code)
+    if manifest is None or _is_stale(language_code, level_code):
+        manifest = build_pack(db, language_code, level_code)
+    return manifest
+
+
+def mark_stale(db: Session, language_id: int, level_id: int) -> Optional[dict]:
+    """
+    Kelimeler değiştiğinde paketi bir sonraki istekte yeniden derlenecek şekilde işaretler
+    """
+    language_code = db.execute(select(Language.code).where(Language.id == language_id)).scalar()
+    level_code = db.execute(select(LanguageLevel.code).where(LanguageLevel.id == level_id)).scalar()
+    if language_code is None or level_code is None:
+        return None
+    directory = _pack_dir(language_code, level_code)
+    os.makedirs(directory, exist_ok=True)
+    open(os.path.join(directory, "stale"), "w").close()
+    return {"language_code": language_code, "level_code": level_code}
+
+
+@job_handler("vocab_pack.build")
+def build_pack_job(db: Session, payload: dict) -> None:
+    build_pack(db, payload["language_code"], payload["level_code"])
+
+
+def build_delta(language_code: str, level_code: str, from_version: str, to_version: str) -> Optional[str]:
+    """
+    İki versiyon arasındaki değişen/silinen kelimeleri içeren delta paketini oluşturur
+    """
+    path = delta_path(language_code, level_code, from_version, to_version)
+    if os.path.exists(path):
+        return path
+    if not os.path.exists(pack_path(language_code, level_code, from_version)):
+        return None
+
+    old_words = _read_pack_words(language_code, level_code, from_version)
+    new_words = _read_pack_words(language_code, level_code, to_version)
+    body = json.dumps(
+        {
+            "language": language_code,
+            "level": level_code,
+            "from_version": from_version,
+            "version": to_version,
+            "upserted": [row for word_id, row in new_words.items() if old_words.get(word_id) != row],
+            "removed": [word_id for word_id in old_words if word_id not in new_words],
+        },
+        ensure_ascii=False, separators=(",", ":"),
+    ).encode()
+    _write_atomic(path, gzip.compress(body, mtime=0))
+    return path
+
+
+def _iter_file_range(path: str, start: int, end: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _parse_range(range_header: str, size: int):
+    unit, _, spec = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    start, _, end = spec.strip().partition("-")
+    if start:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    else:
+        # bytes=-N: son N byte
+        start = max(size - int(end), 0)
+        end = size - 1
+    if start > end or start >= size:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+
+def serve_file(request: Request, path: str, etag: str) -> Response:
+    """
+    Paket dosyasını ETag, koşullu GET ve tek aralıklı Range desteğiyle sunar
+    """
+    size = os.path.getsize(path)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "public, no-cache",
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _iter_file_range(path, start, end),
+                status_code=206,
+                media_type=PACK_MEDIA_TYPE,
+                headers=headers,
+            )
+
+    return FileResponse(path, media_type=PACK_MEDIA_TYPE, headers=headers)
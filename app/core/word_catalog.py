@@ -0,0 +1,229 @@
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from typing import NamedTuple, Optional
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from core import jobs
+from core.config import settings
+from core.grading import normalize_answer
+from core.jobs import job_handler
+from db.models.language import Language
+from db.models.word import Word
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GWC1"
+# magic, byte order, language_id, base_id, slots, words, blob_size
+HEADER = struct.Struct("<4sBxxxIIIII")
+NO_SLOT = -1
+
+
+class CatalogWord(NamedTuple):
+    id: int
+    language_id: int
+    level_id: int
+    translation: str  # normalize_answer ile normalize edilmiş
+
+
+def catalog_path(language_id: int) -> str:
+    return os.path.join(settings.WORD_CATALOG_DIR, f"words-{language_id}.bin")
+
+
+class WordCatalog:
+    """
+    Tek bir dilin salt okunur, mmap'lenmiş kelime kataloğu.
+
+    Dosya düzeni: header | int32 slot[id - base_id] | uint32 level_id[words] |
+    uint32 offset[words + 1] | normalize edilmiş UTF-8 çeviriler.
+    Sayfalar işletim sistemi tarafından worker'lar arasında paylaşılır; id araması O(1)'dir.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        magic, byteorder, self.language_id, self.base_id, slots, words, blob_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or byteorder != (sys.byteorder == "little"):
+            raise ValueError(f"Invalid word catalog: {path}")
+
+        view = memoryview(self._mmap)
+        position = HEADER.size
+        self._slots = view[position:position + slots * 4].cast("i")
+        position += slots * 4
+        self._levels = view[position:position + words * 4].cast("I")
+        position += words * 4
+        self._offsets = view[position:position + (words + 1) * 4].cast("I")
+        position += (words + 1) * 4
+        self._blob = view[position:position + blob_size]
+        self.words = words
+        self.end_id = self.base_id + slots
+
+    def present(self) -> np.ndarray:
+        """Katalogdaki id'ler için True olan, base_id'den başlayan maske"""
+        return np.frombuffer(self._slots, dtype=np.int32) != NO_SLOT
+
+    def get(self, word_id: int) -> Optional[CatalogWord]:
+        index = word_id - self.base_id
+        if index < 0 or index >= len(self._slots):
+            return None
+        slot = self._slots[index]
+        if slot == NO_SLOT:
+            return None
+        translation = bytes(self._blob[self._offsets[slot]:self._offsets[slot + 1]]).decode()
+        return CatalogWord(word_id, self.language_id, self._levels[slot], translation)
+
+
+def build_catalog(db: Session, language_id: int) -> str:
+    """
+    Dilin kataloğunu words tablosundan derler; geçici dosyaya yazıp os.replace ile atomik değiştirir
+    """
+    started = time.perf_counter()
+    rows = db.execute(
+        select(Word.id, Word.level_id, Word.translation)
+        .where(Word.language_id == language_id)
+        .order_by(Word.id)
+    ).all()
+
+    base_id = rows[0].id if rows else 0
+    slots = array("i", [NO_SLOT]) * ((rows[-1].id - base_id + 1) if rows else 0)
+    levels = array("I")
+    offsets = array("I", [0])
+    blob = bytearray()
+    for slot, row in enumerate(rows):
+        slots[row.id - base_id] = slot
+        levels.append(row.level_id)
+        blob += normalize_answer(row.translation).encode()
+        offsets.append(len(blob))
+
+    header = HEADER.pack(
+        MAGIC, sys.byteorder == "little", language_id, base_id, len(slots), len(rows), len(blob)
+    )
+    path = catalog_path(language_id)
+    os.makedirs(settings.WORD_CATALOG_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings.WORD_CATALOG_DIR, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            for part in (header, slots.tobytes(), levels.tobytes(), offsets.tobytes(), blob):
+                tmp.write(part)
+        # Okuyan worker'lar eski dosyayı mmap'te tutmaya devam eder, yenisini stat ile fark eder
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info(
+        "Word catalog for language %s: %d words, %d bytes in %.2fs",
+        language_id, len(rows), os.path.getsize(path), time.perf_counter() - started,
+    )
+    return path
+
+
+class CatalogRegistry:
+    """
+    Dizindeki katalogları açık tutar; dosyalar değiştiyse (yeniden derleme) en fazla
+    WORD_CATALOG_CHECK_SECONDS aralıkla fark edip yeniden mmap'ler.
+    Dillerin id aralıkları iç içe geçebildiğinden id -> katalog sahiplik dizisi tutulur;
+    bir id'nin kataloğu dil sayısından bağımsız O(1) bulunur.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalogs = {}
+        self._index = (0, array("h"), [])
+        self._checked_at = 0.0
+
+    def _refresh(self) -> None:
+        try:
+            names = os.listdir(settings.WORD_CATALOG_DIR)
+        except FileNotFoundError:
+            names = []
+
+        catalogs = {}
+        for name in names:
+            if not (name.startswith("words-") and name.endswith(".bin")):
+                continue
+            path = os.path.join(settings.WORD_CATALOG_DIR, name)
+            try:
+                language_id = int(name[len("words-"):-len(".bin")])
+                current = self._catalogs.get(language_id)
+                stat = os.stat(path)
+                if current is not None and current.identity == (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+                    catalogs[language_id] = current
+                else:
+                    catalogs[language_id] = WordCatalog(path)
+            except (OSError, ValueError):
+                logger.warning("Word catalog %s could not be loaded", path, exc_info=True)
+        # Eski mmap'ler, onları kullanan son istek bitince serbest kalır
+        if catalogs != self._catalogs:
+            self._index = _owner_index(list(catalogs.values()))
+        self._catalogs = catalogs
+
+    def index(self) -> tuple:
+        """(base_id, owners, catalogs): owners[id - base_id] kelimenin catalogs içindeki sırası, yoksa -1"""
+        now = time.monotonic()
+        if now - self._checked_at >= settings.WORD_CATALOG_CHECK_SECONDS:
+            with self._lock:
+                if now - self._checked_at >= settings.WORD_CATALOG_CHECK_SECONDS:
+                    self._refresh()
+                    self._checked_at = now
+        return self._index
+
+
+def _owner_index(catalogs: list) -> tuple:
+    if not catalogs:
+        return 0, array("h"), []
+    base_id = min(catalog.base_id for catalog in catalogs)
+    owners = np.full(max(catalog.end_id for catalog in catalogs) - base_id, -1, dtype=np.int16)
+    for position, catalog in enumerate(catalogs):
+        owners[catalog.base_id - base_id:catalog.end_id - base_id][catalog.present()] = position
+    # Tek tek erişimde array numpy'dan hızlıdır
+    index = array("h")
+    index.frombytes(owners.tobytes())
+    return base_id, index, catalogs
+
+
+registry = CatalogRegistry()
+
+
+def lookup_words(word_ids) -> dict:
+    """
+    Katalogda bulunan kelimeleri {id: CatalogWord} olarak döner (bulunamayanlar DB'den okunmalı)
+    """
+    if not settings.WORD_CATALOG_ENABLED:
+        return {}
+    base_id, owners, catalogs = registry.index()
+    words = {}
+    for word_id in word_ids:
+        position = word_id - base_id
+        if 0 <= position < len(owners) and owners[position] >= 0:
+            words[word_id] = catalogs[owners[position]].get(word_id)
+    return words
+
+
+def enqueue_missing(db: Session) -> int:
+    """
+    Kataloğu henüz derlenmemiş diller için word_catalog.build job'ı ekler (kuyrukta olanı tekrar eklemez).
+    Worker açılışında çalışır; katalog dizini web process'leriyle paylaşılmalıdır. Commit etmez.
+    """
+    added = 0
+    for language_id in db.execute(select(Language.id)).scalars():
+        if os.path.exists(catalog_path(language_id)):
+            continue
+        _, created = jobs.enqueue_unique(db, "word_catalog.build", {"language_id": language_id})
+        added += int(created)
+    return added
+
+
+@job_handler("word_catalog.build")
+def word_catalog_job(db: Session, payload: dict) -> None:
+    build_catalog(db, payload["language_id"])
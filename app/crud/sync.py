@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from typing import List, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from core import word_catalog
+from core.grading import is_correct_answer
+from db.models.user_progress import UserProgress, user_progress_change_seq
+from db.models.word import Word
+from db.models.word_attempt import WordAttempt
+
+CHUNK_SIZE = 1000
+
+
+def _chunks(items: list, size: int = CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _to_utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _load_words(db: Session, word_ids: set) -> dict:
+    # Önce worker'lar arasında paylaşılan katalog; katalogda olmayanlar (yeni kelimeler) DB'den
+    words = word_catalog.lookup_words(word_ids)
+    for chunk in _chunks([word_id for word_id in word_ids if word_id not in words]):
+        stmt = select(Word.id, Word.translation, Word.language_id, Word.level_id).where(Word.id.in_(chunk))
+        for row in db.execute(stmt):
+            words[row.id] = row
+    return words
+
+
+def record_attempts(db: Session, user_id: int, attempts: List[dict]) -> dict:
+    """
+    İstemcide biriken denemeleri tek transaction'da kaydeder ve ilerlemeyi günceller.
+    Aynı istekte tekrarlanan client_id'ler önceden ayıklanır, daha önce gönderilmiş olanlar
+    ON CONFLICT DO NOTHING ile yok sayılır; ikisi de duplicate sayılır.
+    """
+    # Kullanıcının eşzamanlı sync'lerini sırala: change_seq sırası commit sırasıyla aynı kalır
+    db.execute(select(func.pg_advisory_xact_lock(user_id)))
+
+    words = _load_words(db, {attempt["word_id"] for attempt in attempts})
+
+    rows = []
+    seen = set()
+    rejected = 0
+    for attempt in attempts:
+        if attempt["client_id"] in seen:
+            continue
+        seen.add(attempt["client_id"])
+        word = words.get(attempt["word_id"])
+        if word is None:
+            rejected += 1
+            continue
+        rows.append({
+            "user_id": user_id,
+            "word_id": attempt["word_id"],
+            "client_id": attempt["client_id"],
+            "user_answer": attempt["user_answer"],
+            "is_correct": is_correct_answer(word.translation, attempt["user_answer"]),
+            "response_time": attempt.get("response_time"),
+            "attempted_at": _to_utc_naive(attempt["attempted_at"]),
+        })
+
+    # Sadece yeni eklenen denemeler ilerlemeye yansır
+    deltas = {}
+    accepted = 0
+    for chunk in _chunks(rows):
+        stmt = (
+            insert(WordAttempt)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=["user_id", "client_id"])
+            .returning(WordAttempt.word_id, WordAttempt.is_correct, WordAttempt.attempted_at)
+        )
+        for word_id, is_correct, attempted_at in db.execute(stmt):
+            accepted += 1
+            word = words[word_id]
+            delta = deltas.setdefault((word.language_id, word.level_id), [0, 0, attempted_at])
+            delta[0] += 1
+            delta[1] += int(is_correct)
+            delta[2] = max(delta[2], attempted_at)
+
+    apply_progress_deltas(db, user_id, deltas)
+    db.commit()
+
+    return {
+        "accepted": accepted,
+        "duplicates": len(attempts) - accepted - rejected,
+        "rejected": rejected,
+    }
+
+
+def apply_progress_deltas(db: Session, user_id: int, deltas: dict) -> None:
+    """
+    (language_id, level_id) -> [deneme, doğru, son aktivite] farklarını user_progress'e upsert eder
+    """
+    for (language_id, level_id), (attempt_count, correct_count, last_activity) in deltas.items():
+        stmt = insert(UserProgress).values(
+            user_id=user_id,
+            language_id=language_id,
+            level_id=level_id,
+            total_attempts=attempt_count,
+            correct_answers=correct_count,
+            success_rate=correct_count * 100.0 / attempt_count,
+            is_unlocked=True,
+            started_at=last_activity,
+            last_activity=last_activity,
+        )
+        total_attempts = UserProgress.total_attempts + stmt.excluded.total_attempts
+        correct_answers = UserProgress.correct_answers + stmt.excluded.correct_answers
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "language_id", "level_id"],
+            set_={
+                "total_attempts": total_attempts,
+                "correct_answers": correct_answers,
+                "success_rate": correct_answers * 100.0 / total_attempts,
+                "last_activity": func.greatest(UserProgress.last_activity, stmt.excluded.last_activity),
+                "change_seq": user_progress_change_seq.next_value(),
+            },
+        )
+        db.execute(stmt)
+
+
+def get_progress_changes(db: Session, user_id: int, after_seq: int, limit: int) -> Tuple[List[UserProgress], bool]:
+    """
+    Cursor'dan sonra değişen ilerleme kayıtlarını change_seq sırasıyla getirir
+    """
+    stmt = (
+        select(UserProgress)
+        .where(UserProgress.user_id == user_id, UserProgress.change_seq > after_seq)
+        .order_by(UserProgress.change_seq)
+        .limit(limit + 1)
+    )
+    rows = db.execute(stmt).scalars().all()
+    return rows[:limit], len(rows) > limit
@@ -1,17 +1,23 @@
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from db.models.user import User, UserProvider, UserRole
 from core.security import get_password_hash, verify_password
+from core import cache_bus
 from typing import Optional
 
+# Sık çalışan sorgular import sırasında bir kez kurulur; SQLAlchemy derlenmiş hallerini cache'ler
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     """ID ile kullanıcı getirir"""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.execute(USER_BY_ID, {"user_id": user_id}).scalars().first()
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """Email ile kullanıcı getirir"""
-    return db.query(User).filter(User.email == email).first()
+    return db.execute(USER_BY_EMAIL, {"email": email}).scalars().first()
 
 
 def create_user(
@@ -55,6 +61,7 @@ def update_user_last_login(db: Session, user_id: int):
         from datetime import datetime
 
         user.last_login = datetime.utcnow()
+        cache_bus.publish(db, "user", user_id)
         db.commit()
         db.refresh(user)
 
@@ -66,6 +73,7 @@ def update_user(db: Session, user_id: int, **kwargs) -> Optional[User]:
         for key, value in kwargs.items():
             if hasattr(user, key):
                 setattr(user, key, value)
+        cache_bus.publish(db, "user", user_id)
         db.commit()
         db.refresh(user)
     return user
@@ -0,0 +1,155 @@
+import random
+from typing import List, Optional
+from sqlalchemy import exists, func, or_, select, insert
+from sqlalchemy.orm import Session
+from db.models.word import FTS_CONFIG, Word, example_sentence_document
+from db.models.word_stat import WordStat
+from db.models.user_ability import UserAbility
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_words(db: Session, language_id: int, query: str, limit: int = 20) -> List[Word]:
+    """
+    Kelime ve çevirisinde fuzzy/substring arama yapar (pg_trgm GIN index'leri kullanılır)
+    """
+    pattern = f"%{_escape_like(query)}%"
+    score = func.greatest(func.similarity(Word.text, query), func.similarity(Word.translation, query))
+    stmt = (
+        select(Word)
+        .where(
+            Word.language_id == language_id,
+            or_(
+                Word.text.ilike(pattern, escape="\\"),
+                Word.translation.ilike(pattern, escape="\\"),
+                Word.text.op("%")(query),
+                Word.translation.op("%")(query),
+            ),
+        )
+        .order_by(score.desc(), Word.text)
+        .limit(limit)
+    )
+    return db.execute(stmt).scalars().all()
+
+
+def search_example_sentences(db: Session, language_id: int, query: str, limit: int = 20) -> List[Word]:
+    """
+    Örnek cümlelerde full-text arama yapar (ix_words_example_sentence_fts index'i ile aynı ifade)
+    """
+    document = example_sentence_document(Word.example_sentence)
+    ts_query = func.plainto_tsquery(FTS_CONFIG, query)
+    stmt = (
+        select(Word)
+        .where(Word.language_id == language_id, document.op("@@")(ts_query))
+        .order_by(func.ts_rank(document, ts_query).desc())
+        .limit(limit)
+    )
+    return db.execute(stmt).scalars().all()
+
+
+# Yetenek etrafında denenen zorluk bantları (logit); yeterli kelime bulunana kadar genişletilir
+ABILITY_BANDS = (0.25, 0.5, 1.0, 2.0)
+CANDIDATE_FACTOR = 5
+
+
+def _unrated_words(db: Session, language_id: int, level_id: Optional[int], limit: int) -> list:
+    """
+    İstatistiği olmayan kelimelerden rastgele bir id noktasından başlayan (sona gelince başa saran)
+    bir dilim okur; tüm kelimeleri random() ile sıralamadan her oturumda farklı adaylar verir
+    """
+    stmt = select(Word).where(Word.language_id == language_id, ~exists().where(WordStat.word_id == Word.id))
+    if level_id is not None:
+        stmt = stmt.where(Word.level_id == level_id)
+    low, high = db.execute(select(func.min(Word.id), func.max(Word.id)).where(Word.language_id == language_id)).one()
+    if low is None:
+        return []
+    pivot = random.randint(low, high)
+    words = db.execute(stmt.where(Word.id >= pivot).order_by(Word.id).limit(limit)).scalars().all()
+    if len(words) < limit:
+        words += db.execute(stmt.where(Word.id < pivot).order_by(Word.id).limit(limit - len(words))).scalars().all()
+    return words
+
+
+def _words_in_band(db: Session, language_id: int, level_id: Optional[int], low: float, high: float, limit: int) -> list:
+    # Bant difficulty index'iyle daraltıldığından random() sıralaması yalnızca bant içindeki satırlara uygulanır
+    stmt = (
+        select(Word)
+        .join(WordStat, WordStat.word_id == Word.id)
+        .where(Word.language_id == language_id, WordStat.difficulty.between(low, high))
+        .order_by(func.random())
+        .limit(limit)
+    )
+    if level_id is not None:
+        stmt = stmt.where(Word.level_id == level_id)
+    words = db.execute(stmt).scalars().all()
+
+    # İstatistiği olmayan kelimeler 0 zorlukta kabul edilir
+    if low <= 0.0 <= high and len(words) < limit:
+        words += _unrated_words(db, language_id, level_id, limit - len(words))
+    return words
+
+
+def get_words_near_ability(
+    db: Session,
+    user_id: int,
+    language_id: int,
+    level_id: Optional[int] = None,
+    limit: int = 20,
+) -> List[Word]:
+    """
+    Zorluğu kullanıcının yeteneğine en yakın kelimeleri getirir (istatistiği olmayan kelimeler 0 kabul edilir).
+    Tüm dili sıralamak yerine yetenek etrafındaki dar bir zorluk bandı difficulty index'i ile okunur,
+    az kelime dönerse bant genişletilir; küçük aday kümesi karıştırılır.
+    """
+    ability = db.execute(
+        select(UserAbility.ability).where(UserAbility.user_id == user_id)
+    ).scalar() or 0.0
+
+    for band in ABILITY_BANDS:
+        words = _words_in_band(db, language_id, level_id, ability - band, ability + band, limit * CANDIDATE_FACTOR)
+        if len(words) >= limit:
+            return random.sample(words, limit)
+
+    # Bantlar yetmediyse (az kelimeli dil/seviye) en yakınları sırala
+    distance = func.abs(func.coalesce(WordStat.difficulty, 0.0) - ability)
+    stmt = (
+        select(Word)
+        .outerjoin(WordStat, WordStat.word_id == Word.id)
+        .where(Word.language_id == language_id)
+        .order_by(distance)
+        .limit(limit)
+    )
+    if level_id is not None:
+        stmt = stmt.where(Word.level_id == level_id)
+    words = db.execute(stmt).scalars().all()
+    random.shuffle(words)
+    return words
+
+
+def get_autocomplete_rows(db: Session, language_id: int):
+    """Autocomplete index'i için dilin kelimelerini getirir"""
+    stmt = select(Word.id, Word.text, Word.translation).where(Word.language_id == language_id)
+    return db.execute(stmt).all()
+
+
+def get_autocomplete_signature(db: Session, language_id: int) -> tuple:
+    """
+    Dilin kelimelerinin özeti (sayı, en büyük id, içerik hash toplamı); satırları aktarmadan
+    autocomplete index'inin yeniden oluşturulması gerekip gerekmediğini anlamak için
+    """
+    row_hash = func.hashtext(func.concat_ws("|", Word.id, Word.text, Word.translation))
+    stmt = select(
+        func.count(Word.id), func.max(Word.id), func.coalesce(func.sum(row_hash), 0)
+    ).where(Word.language_id == language_id)
+    return tuple(db.execute(stmt).one())
+
+
+def bulk_create_words(db: Session, words: List[dict]) -> int:
+    """Kelimeleri toplu olarak ekler"""
+    if not words:
+        return 0
+    db.execute(insert(Word), words)
+    db.commit()
+    return len(words)
@@ -4,3 +4,6 @@ from .language_level import LanguageLevel
 from .word import Word
 from .user_progress import UserProgress
 from .word_attempt import WordAttempt
+from .job import Job
+from .word_stat import WordStat
+from .user_ability import UserAbility
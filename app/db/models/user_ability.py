@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Float
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from db.base import Base
+
+
+class UserAbility(Base):
+    __tablename__ = "user_abilities"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # Fitted model values
+    ability = Column(Float, nullable=False, default=0.0)  # IRT/Elo ability (logit scale, same as word difficulty)
+    attempts = Column(Integer, nullable=False, default=0)  # Attempts used in the fit
+
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    user = relationship("User")
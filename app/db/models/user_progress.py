@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, DateTime, Float, Boolean, Sequence, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from db.base import Base
 
+# Offline sync için her insert/update'te artan değişiklik sırası
+user_progress_change_seq = Sequence("user_progress_change_seq", metadata=Base.metadata)
+
 
 class UserProgress(Base):
     __tablename__ = "user_progress"
@@ -28,7 +31,20 @@ class UserProgress(Base):
     completed_at = Column(DateTime, nullable=True)
     last_activity = Column(DateTime, default=datetime.utcnow)
     
+    # Sync cursor
+    change_seq = Column(
+        BigInteger,
+        nullable=False,
+        server_default=user_progress_change_seq.next_value(),
+        onupdate=user_progress_change_seq.next_value(),
+    )  # Monotonically increasing change sequence
+    
     # Relationships
     user = relationship("User", back_populates="progress")
     language = relationship("Language", back_populates="user_progress")
     level = relationship("LanguageLevel", back_populates="user_progress")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "language_id", "level_id", name="uq_user_progress_user_language_level"),
+        Index("ix_user_progress_user_change_seq", "user_id", "change_seq"),
+    )
@@ -1,8 +1,18 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index, func, literal_column
 from sqlalchemy.orm import relationship
 
 from db.base import Base
 
+# FTS dil ayarı DDL'de bind parametresi olamaz, literal olarak yazılır
+FTS_CONFIG = literal_column("'simple'")
+
+
+def example_sentence_document(example_sentence):
+    """
+    Örnek cümle FTS ifadesi; index ve sorgular planner'ın eşleştirmesi için aynı ifadeyi kullanmalı
+    """
+    return func.to_tsvector(FTS_CONFIG, func.coalesce(example_sentence, literal_column("''")))
+
 
 class Word(Base):
     __tablename__ = "words"
@@ -21,3 +31,17 @@ class Word(Base):
     language = relationship("Language", back_populates="words")
     level = relationship("LanguageLevel", back_populates="words")
     attempts = relationship("WordAttempt", back_populates="word")
+
+    # Search indexes (pg_trgm extension gerekli: CREATE EXTENSION IF NOT EXISTS pg_trgm)
+    __table_args__ = (
+        Index("ix_words_text_trgm", "text", postgresql_using="gin", postgresql_ops={"text": "gin_trgm_ops"}),
+        Index(
+            "ix_words_translation_trgm", "translation",
+            postgresql_using="gin", postgresql_ops={"translation": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_words_example_sentence_fts",
+            example_sentence_document(example_sentence),
+            postgresql_using="gin",
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -18,6 +18,7 @@ class WordAttempt(Base):
     user_answer = Column(String(255), nullable=False)  # User's answer
     is_correct = Column(Boolean, nullable=False)  # Whether the answer was correct
     response_time = Column(Integer, nullable=True)  # Response time in milliseconds
+    client_id = Column(String(64), nullable=True)  # Client-generated id for idempotent offline sync
     
     # Timestamps
     attempted_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -25,3 +26,7 @@ class WordAttempt(Base):
     # Relationships
     user = relationship("User", back_populates="word_attempts")
     word = relationship("Word", back_populates="attempts")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "client_id", name="uq_word_attempts_user_client"),
+    )
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Float
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from db.base import Base
+
+
+class WordStat(Base):
+    __tablename__ = "word_stats"
+
+    word_id = Column(Integer, ForeignKey("words.id", ondelete="CASCADE"), primary_key=True)
+
+    # Fitted model values
+    difficulty = Column(Float, nullable=False, default=0.0, index=True)  # IRT/Elo difficulty (logit scale)
+    attempts = Column(Integer, nullable=False, default=0)  # Attempts used in the fit
+    correct = Column(Integer, nullable=False, default=0)  # Correct answers used in the fit
+    avg_response_time = Column(Float, nullable=True)  # Average response time in milliseconds
+
+    # Timestamps
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    word = relationship("Word")
@@ -0,0 +1,73 @@
+import json
+import logging
+import select
+import threading
+import time
+from typing import Callable, Iterable, Optional
+from sqlalchemy import create_engine, func, select as sa_select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from db.session import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+# LISTEN bağlantıları süreç boyunca açık kalır; request havuzundan slot almasınlar diye ayrı, havuzsuz engine
+listen_engine = create_engine(DATABASE_URL, poolclass=NullPool)
+
+
+def notify(db: Session, channel: str, payload) -> None:
+    """
+    Postgres NOTIFY gönderir (transaction commit edildiğinde dinleyicilere ulaşır)
+    """
+    if not isinstance(payload, str):
+        payload = json.dumps(payload, separators=(",", ":"))
+    db.execute(sa_select(func.pg_notify(channel, payload)))
+
+
+def listen(
+    channels: Iterable[str],
+    on_message: Callable[[str, str], None],
+    stop: threading.Event,
+    on_connect: Optional[Callable[[], None]] = None,
+    poll_seconds: float = 5.0,
+    retry_seconds: float = 2.0,
+) -> None:
+    """
+    Ayrılmış bir bağlantı üzerinden LISTEN yapar, stop set edilene kadar bildirimleri on_message'a iletir.
+    Bağlantı koparsa yeniden bağlanır ve on_connect çağrılır (kaçırılan bildirimler için).
+    """
+    while not stop.is_set():
+        connection = None
+        try:
+            connection = listen_engine.raw_connection()
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                for channel in channels:
+                    cursor.execute(f'LISTEN "{channel}"')
+            if on_connect is not None:
+                on_connect()
+
+            while not stop.is_set():
+                readable, _, _ = select.select([dbapi_connection], [], [], poll_seconds)
+                if not readable:
+                    # Bağlantının canlı olduğunu kontrol et
+                    with dbapi_connection.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                    continue
+                dbapi_connection.poll()
+                while dbapi_connection.notifies:
+                    message = dbapi_connection.notifies.pop(0)
+                    try:
+                        on_message(message.channel, message.payload)
+                    except Exception:
+                        logger.exception("Notification handler failed on %s", message.channel)
+        except Exception:
+            logger.exception("LISTEN connection lost, reconnecting")
+            time.sleep(retry_seconds)
+        finally:
+            if connection is not None:
+                try:
+                    connection.invalidate()
+                except Exception:
+                    pass
@@ -1,5 +1,10 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import bisect
+import itertools
+import threading
+import time
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.requests import HTTPConnection
 from core.config import settings
 
 DATABASE_URL = (
@@ -8,14 +13,322 @@ DATABASE_URL = (
     f"{settings.DB_PORT}/{settings.DB_NAME}"
 )
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, query_cache_size=settings.DB_QUERY_CACHE_SIZE)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def get_db():
-    db = SessionLocal()
+class ReplicaSet:
+    """
+    Read replica engine'leri arasında round-robin seçim ve sağlık takibi yapar
+    """
+
+    def __init__(self, engines, retry_seconds: int = 30):
+        self.engines = list(engines)
+        self.retry_seconds = retry_seconds
+        self._down_until = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        for replica in self.engines:
+            self._watch(replica)
+
+    def _watch(self, replica):
+        @event.listens_for(replica, "handle_error")
+        def _on_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(replica)
+
+    def mark_down(self, replica):
+        with self._lock:
+            self._down_until[replica] = time.monotonic() + self.retry_seconds
+
+    def _is_healthy(self, replica) -> bool:
+        down_until = self._down_until.get(replica)
+        if down_until is None:
+            return True
+        if time.monotonic() < down_until:
+            return False
+
+        # Bekleme süresi doldu, replica'yı tekrar kontrol et
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception:
+            self.mark_down(replica)
+            return False
+        with self._lock:
+            self._down_until.pop(replica, None)
+        return True
+
+    def choose(self):
+        """
+        Sıradaki sağlıklı replica'yı döner, hiçbiri yoksa primary engine'i döner
+        """
+        if not self.engines:
+            return engine
+        start = next(self._counter)
+        for offset in range(len(self.engines)):
+            replica = self.engines[(start + offset) % len(self.engines)]
+            if self._is_healthy(replica):
+                return replica
+        return engine
+
+
+def _create_replica_set() -> ReplicaSet:
+    urls = [url.strip() for url in settings.DB_READ_REPLICA_URLS.split(",") if url.strip()]
+    return ReplicaSet(
+        [create_engine(url, pool_pre_ping=True, query_cache_size=settings.DB_QUERY_CACHE_SIZE) for url in urls],
+        retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+    )
+
+
+replicas = _create_replica_set()
+
+
+# Yazma yapan kullanıcıların kısa süre primary'den okuması için (read-your-writes)
+_sticky_users = {}
+
+
+_sticky_lock = threading.Lock()
+_sticky_swept_at = 0.0
+
+
+def _sweep_sticky_users(now: float) -> None:
+    global _sticky_swept_at
+    if now - _sticky_swept_at < settings.DB_READ_STICKY_SECONDS:
+        return
+    with _sticky_lock:
+        _sticky_swept_at = now
+        for user_id, until in list(_sticky_users.items()):
+            if until <= now:
+                _sticky_users.pop(user_id, None)
+
+
+def mark_user_write(user_id: int) -> None:
+    """
+    Kullanıcının kendi yazmasını replica gecikmesine takılmadan görmesini sağlar
+    """
+    now = time.monotonic()
+    _sticky_users[user_id] = now + settings.DB_READ_STICKY_SECONDS
+    # Süresi dolan kayıtlar sözlükte birikmesin
+    _sweep_sticky_users(now)
+
+
+def is_user_sticky(user_id: int) -> bool:
+    until = _sticky_users.get(user_id)
+    if until is None:
+        return False
+    if time.monotonic() >= until:
+        _sticky_users.pop(user_id, None)
+        return False
+    return True
+
+
+class RoutingSession(Session):
+    """
+    Okuma sorgularını replica'ya, yazma ve flush işlemlerini primary'ye yönlendirir
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or self.info.get("use_primary"):
+            return engine
+        read_engine = self.info.get("read_engine")
+        if read_engine is None:
+            read_engine = self.info["read_engine"] = replicas.choose()
+        return read_engine
+
+    def use_primary(self) -> None:
+        """
+        Bu session'ın bundan sonraki sorgularını primary'ye yönlendirir
+        """
+        self.info["use_primary"] = True
+
+
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+
+
+class ConnectionHoldStats:
+    """
+    Request başına bağlantı tutma süresi istatistikleri (ms)
+    """
+
+    BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.without_connection = 0
+            self.total_ms = 0.0
+            self.max_ms = 0.0
+            self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+
+    def record(self, held_seconds) -> None:
+        with self._lock:
+            self.requests += 1
+            if held_seconds is None:
+                self.without_connection += 1
+                return
+            held_ms = held_seconds * 1000
+            self.total_ms += held_ms
+            self.max_ms = max(self.max_ms, held_ms)
+            self.histogram[bisect.bisect_left(self.BUCKETS_MS, held_ms)] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            with_connection = self.requests - self.without_connection
+            labels = [f"<={bucket}ms" for bucket in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+            return {
+                "requests": self.requests,
+                "without_connection": self.without_connection,
+                "avg_hold_ms": round(self.total_ms / with_connection, 2) if with_connection else None,
+                "max_hold_ms": round(self.max_ms, 2),
+                "histogram": dict(zip(labels, self.histogram)),
+            }
+
+
+hold_stats = ConnectionHoldStats()
+
+
+def _on_after_begin(session, transaction, connection):
+    session.info.setdefault("held_since", time.perf_counter())
+
+
+def _on_after_transaction_end(session, transaction):
+    # Kök transaction bittiğinde bağlantı havuza döner
+    if transaction.parent is None:
+        started = session.info.pop("held_since", None)
+        if started is not None:
+            session.info["held_seconds"] = session.info.get("held_seconds", 0.0) + time.perf_counter() - started
+
+
+for _factory in (SessionLocal, ReadSessionLocal):
+    event.listen(_factory, "after_begin", _on_after_begin)
+    event.listen(_factory, "after_transaction_end", _on_after_transaction_end)
+
+
+class LazySession:
+    """
+    Request-scoped session proxy'si: session ilk kullanımda oluşturulur, bağlantı ilk sorguda alınır.
+    Commit'te nesneler expire edilmez; böylece release() ile bağlantı erken iade edilse de
+    yüklenmiş nesneler yeni sorgu yapmadan kullanılabilir.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory: sessionmaker):
+        self._factory = factory
+        self._session = None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._factory(expire_on_commit=False)
+        return self._session
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def release(self) -> None:
+        """
+        Bekleyen değişiklik yoksa transaction'ı bitirip bağlantıyı havuza hemen iade eder
+        """
+        session = self._session
+        if session is None or not session.in_transaction():
+            return
+        if session.new or session.dirty or session.deleted:
+            return
+        session.commit()
+
+    def finish(self) -> None:
+        """
+        Commit edilmemiş değişiklikleri geri alır, yoksa transaction'ı bitirir; bağlantı havuza döner.
+        Paylaşılan (batch) session'ı bir sonraki kullanıma temiz bırakmak için kullanılır.
+        """
+        session = self._session
+        if session is None or not session.in_transaction():
+            return
+        if not session.is_active or session.new or session.dirty or session.deleted:
+            session.rollback()
+        else:
+            session.commit()
+
+    def close(self) -> None:
+        session = self._session
+        if session is None:
+            hold_stats.record(None)
+            return
+        session.close()
+        hold_stats.record(session.info.get("held_seconds"))
+
+
+def batch_session(connection: HTTPConnection, factory: sessionmaker):
+    """
+    Batch alt isteğinde batch boyunca paylaşılan session'ı döner (batch değilse None).
+    Session'ları batch endpoint'i kapatır.
+    """
+    batch = connection.scope.get("batch")
+    if batch is None:
+        return None
+    sessions = batch["sessions"]
+    db = sessions.get(factory)
+    if db is None:
+        db = sessions[factory] = LazySession(factory)
+    return db
+
+
+def _request_session(connection: HTTPConnection, factory: sessionmaker):
+    db = batch_session(connection, factory)
+    if db is not None:
+        yield db
+        return
+    db = LazySession(factory)
+    connection.scope.setdefault("db_sessions", []).append(db)
     try:
         yield db
     finally:
         db.close()
+
+
+def get_db(connection: HTTPConnection):
+    yield from _request_session(connection, SessionLocal)
+
+
+def get_read_db(connection: HTTPConnection):
+    yield from _request_session(connection, ReadSessionLocal)
+
+
+def release_sessions(connection: HTTPConnection):
+    """
+    Endpoint döndükten ve yanıt serialize edildikten sonra, yanıt gönderilmeden önce request'in
+    session'larının bağlantılarını havuza iade eder (bekleyen değişikliği olanlar hariç).
+    Router'a Depends(release_sessions, scope="function") olarak eklenir; session'ları kapatmak
+    get_db/get_read_db'nin teardown'ında, yanıt gönderildikten sonra kalır.
+    """
+    yield
+    for db in connection.scope.get("db_sessions", ()):
+        db.release()
+
+
+def _pool_status(bind) -> dict:
+    pool = bind.pool
+    return {
+        "url": bind.url.render_as_string(hide_password=True),
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
+def pool_stats() -> dict:
+    """
+    Primary ve replica bağlantı havuzlarının anlık doluluğu
+    """
+    return {
+        "primary": _pool_status(engine),
+        "replicas": [_pool_status(replica) for replica in replicas.engines],
+    }
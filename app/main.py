@@ -1,7 +1,22 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from api.v1 import api_router
+from core import cache_bus
+from core.compression import CompressionMiddleware
+from core.config import settings
+from core.profiler import ProfilerMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Worker başına cache invalidation dinleyicisi
+    cache_bus.start()
+    yield
+    cache_bus.stop()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Gurulingua FastAPI Backend",
     description="Gurulingua FastAPI Backend",
     version="0.1.0",
@@ -14,5 +29,8 @@ app = FastAPI(
     allow_credentials=True,
 )
 
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 app.include_router(api_router, prefix="/api/v1")
 
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class BatchSubRequest(BaseModel):
+    method: str = "GET"
+    path: str  # /api/v1 altındaki yol, örn: /user/me
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
+
+class BatchSubResponse(BaseModel):
+    status: int
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchSubResponse]
@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class JobCreate(BaseModel):
+    type: str
+    payload: Dict[str, Any] = {}
+    delay_seconds: int = Field(0, ge=0)
+    max_attempts: int = Field(5, ge=1, le=50)
+
+
+class JobResponse(BaseModel):
+    id: int
+    type: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str]
+    run_at: datetime
+    created_at: Optional[datetime]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    lease_until: Optional[datetime] = None
+    locked_by: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class JobTypeStats(BaseModel):
+    type: str
+    status: str
+    count: int
+    avg_seconds: Optional[float]
+
+
+class JobStats(BaseModel):
+    stats: List[JobTypeStats]
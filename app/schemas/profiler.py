@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class ProfileArm(BaseModel):
+    path: Optional[str] = Field(None, description="fnmatch deseni, örn. /api/v1/word/*; boşsa sadece token başlığı")
+    method: Optional[str] = None
+    count: int = Field(1, ge=1, le=100)
+    ttl_seconds: int = Field(300, ge=10, le=3600)
+
+
+class ProfileCapture(BaseModel):
+    id: str
+    token: str
+    path: Optional[str]
+    method: Optional[str]
+    status: str
+    requested: int
+    remaining: int
+    created_at: datetime
+    samples: int
+    requests: List[Dict[str, Any]]
+
+
+class ProfileFunction(BaseModel):
+    function: str
+    self_samples: int
+    total_samples: int
+    self_percent: float
+    total_percent: float
+
+
+class ProfileStatement(BaseModel):
+    statement: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+
+class ProfileReport(ProfileCapture):
+    functions: List[ProfileFunction]
+    sql: List[ProfileStatement]
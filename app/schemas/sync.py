@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+# word_attempts integer kolonlarının sınırı
+MAX_INT32 = 2**31 - 1
+# Tek denemenin makul en uzun cevaplama süresi (ms)
+MAX_RESPONSE_TIME_MS = 24 * 60 * 60 * 1000
+
+
+class AttemptUpload(BaseModel):
+    client_id: str = Field(..., min_length=1, max_length=64)  # İstemcinin ürettiği tekil id
+    word_id: int = Field(..., ge=1, le=MAX_INT32)
+    user_answer: str = Field(..., max_length=255)
+    response_time: Optional[int] = Field(None, ge=0, le=MAX_RESPONSE_TIME_MS)  # milliseconds
+    attempted_at: datetime
+
+
+class AttemptUploadBatch(BaseModel):
+    attempts: List[AttemptUpload]
+
+
+class AttemptUploadResult(BaseModel):
+    accepted: int  # Yeni kaydedilen denemeler
+    duplicates: int  # Daha önce veya aynı istekte tekrar gönderilmiş (yok sayılan) denemeler
+    rejected: int  # Bilinmeyen kelimeye ait denemeler
+
+
+class ProgressChange(BaseModel):
+    language_id: int
+    level_id: int
+    total_words: int
+    correct_answers: int
+    total_attempts: int
+    success_rate: float
+    is_completed: bool
+    is_unlocked: bool
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    last_activity: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class ProgressChanges(BaseModel):
+    changes: List[ProgressChange]
+    cursor: str  # Bir sonraki istekte gönderilecek opak cursor
+    has_more: bool
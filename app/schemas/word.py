@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class WordCreate(BaseModel):
+    text: str
+    translation: str
+    pronunciation: Optional[str] = None
+    example_sentence: Optional[str] = None
+    language_id: int
+    level_id: int
+
+
+class WordImport(BaseModel):
+    words: List[WordCreate]
+
+
+class WordResponse(BaseModel):
+    id: int
+    text: str
+    translation: str
+    pronunciation: Optional[str] = None
+    example_sentence: Optional[str] = None
+    language_id: int
+    level_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class WordSuggestion(BaseModel):
+    id: int
+    text: str
+    translation: str
@@ -0,0 +1,127 @@
+import argparse
+import logging
+import signal
+import threading
+import time
+from core import export, jobs, word_catalog
+from core.config import settings
+from db.notify import listen
+from db.session import SessionLocal
+
+logger = logging.getLogger("worker")
+
+
+class WorkerPool:
+    """
+    Bir process içinde N adet job worker thread'i ve tek bir LISTEN thread'i çalıştırır
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.stop = threading.Event()
+        self.wakeup = threading.Condition()
+        self.threads = []
+
+    def _on_notify(self, channel: str, payload: str):
+        with self.wakeup:
+            self.wakeup.notify()
+
+    def _on_connect(self):
+        # Bağlantı koptuğu sırada kaçan bildirimler için tüm worker'ları uyandır
+        with self.wakeup:
+            self.wakeup.notify_all()
+
+    def _work(self):
+        while not self.stop.is_set():
+            db = SessionLocal()
+            try:
+                job = jobs.claim_job(db)
+                if job is not None:
+                    jobs.run_job(db, job)
+                    continue
+            except Exception:
+                logger.exception("Worker loop failed")
+                time.sleep(settings.JOB_POLL_SECONDS)
+            finally:
+                db.close()
+
+            with self.wakeup:
+                self.wakeup.wait(settings.JOB_POLL_SECONDS)
+
+    def _maintain(self):
+        last_report = time.monotonic()
+        while not self.stop.wait(settings.JOB_POLL_SECONDS):
+            db = SessionLocal()
+            try:
+                requeued = jobs.requeue_stale_jobs(db)
+                if requeued:
+                    logger.warning("Requeued %s stale jobs", requeued)
+            except Exception:
+                logger.exception("Stale job check failed")
+            finally:
+                db.close()
+
+            if time.monotonic() - last_report >= 60:
+                last_report = time.monotonic()
+                logger.info("Job metrics: %s", jobs.metrics.snapshot())
+                try:
+                    removed = export.cleanup_exports()
+                    if removed:
+                        logger.info("Removed %s expired export archives", removed)
+                except OSError:
+                    logger.exception("Export cleanup failed")
+
+    def start(self):
+        targets = [
+            lambda: listen([jobs.JOB_CHANNEL], self._on_notify, self.stop, on_connect=self._on_connect),
+            self._maintain,
+        ] + [self._work] * self.concurrency
+        for target in targets:
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def shutdown(self, *_):
+        self.stop.set()
+        with self.wakeup:
+            self.wakeup.notify_all()
+
+
+def enqueue_missing_catalogs():
+    # Yeni kurulumda/deploy'da katalog dosyaları yoksa sync kelimeleri DB'den okur; derlemeyi başlat
+    db = SessionLocal()
+    try:
+        added = word_catalog.enqueue_missing(db)
+        db.commit()
+        if added:
+            logger.info("Enqueued word catalog builds for %s languages", added)
+    except Exception:
+        logger.exception("Word catalog check failed")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gurulingua background job worker")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    handlers = jobs.load_handlers()
+    logger.info("Starting %s workers for job types: %s", args.concurrency, ", ".join(sorted(handlers)))
+    if settings.WORD_CATALOG_ENABLED:
+        enqueue_missing_catalogs()
+
+    pool = WorkerPool(args.concurrency)
+    signal.signal(signal.SIGTERM, pool.shutdown)
+    signal.signal(signal.SIGINT, pool.shutdown)
+    pool.start()
+    while not pool.stop.wait(1):
+        pass
+    for thread in pool.threads:
+        thread.join(timeout=30)
+    logger.info("Final job metrics: %s", jobs.metrics.snapshot())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Autocomplete prefix index benchmark'ı: oluşturma süresi, bellek ve sorgu gecikmesi.
+
+Kullanım (app ayarları ortamdan/.env'den okunur, veritabanı gerekmez):
+    cd app && python ../scripts/bench_autocomplete.py --words 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from core.autocomplete import PrefixIndex  # noqa: E402
+
+
+def synthetic_rows(count: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase + "çğıöşü"
+    rows = []
+    for word_id in range(1, count + 1):
+        text = "".join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        translation = "".join(rng.choice(letters) for _ in range(rng.randint(3, 14)))
+        rows.append((word_id, text.capitalize(), translation))
+    return rows
+
+
+class DictPrefixIndex:
+    """
+    Karşılaştırma için önceki düzen: kelime başına öneri dict'i ve iki paralel liste
+    """
+
+    def __init__(self, rows):
+        entries = []
+        for word_id, text, translation in rows:
+            suggestion = {"id": word_id, "text": text, "translation": translation}
+            entries.append((text.casefold(), word_id, suggestion))
+            entries.append((translation.casefold(), word_id, suggestion))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self._keys = [entry[0] for entry in entries]
+        self._suggestions = [entry[2] for entry in entries]
+
+
+def measure_memory(factory, rows) -> tuple:
+    tracemalloc.start()
+    index = factory(rows)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.words, args.seed)
+    print(f"words: {args.words:,}")
+
+    for name, factory in (("columnar (PrefixIndex)", PrefixIndex), ("dict-per-word (previous)", DictPrefixIndex)):
+        retained, peak = measure_memory(factory, rows)
+        print(f"{name:26} retained {retained / 2**20:8.1f} MiB   build peak {peak / 2**20:8.1f} MiB")
+
+    started = time.perf_counter()
+    index = PrefixIndex(rows)
+    print(f"build time: {time.perf_counter() - started:.2f}s ({len(index):,} keys)")
+
+    rng = random.Random(args.seed + 1)
+    prefixes = []
+    for _ in range(args.queries):
+        _, text, translation = rows[rng.randrange(len(rows))]
+        source = text if rng.random() < 0.5 else translation
+        prefixes.append(source[:rng.randint(1, 4)])
+
+    latencies = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        index.complete(prefix, limit=10)
+        latencies.append((time.perf_counter() - started) * 1e6)
+    latencies.sort()
+    print(
+        f"complete(limit=10) over {args.queries:,} queries: "
+        f"p50 {statistics.median(latencies):.1f}us  "
+        f"p99 {latencies[int(len(latencies) * 0.99)]:.1f}us  "
+        f"max {latencies[-1]:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Yanıt sıkıştırma benchmark'ı: kodlama ve seviye başına CPU süresi ve sıkıştırma oranı.
+core/config.py'deki COMPRESSION_* seviyeleri bu çıktıya göre seçilir.
+
+Kullanım (app ayarları ortamdan/.env'den okunur, veritabanı gerekmez):
+    cd app && python ../scripts/bench_compression.py
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from core.compression import brotli, zstandard  # noqa: E402
+
+LEVELS = {
+    "gzip": (1, 4, 6, 9),
+    "br": (1, 3, 4, 5, 6, 9, 11),
+    "zstd": (1, 3, 6, 9, 12, 19),
+}
+
+
+class _Text:
+    """
+    Gerçek dile yakın tekrar oranı için sözde kelimeleri Zipf dağılımıyla seçer
+    """
+
+    def __init__(self, rng: random.Random, vocabulary: int = 3000):
+        letters = string.ascii_lowercase + "çğıöşü"
+        self.rng = rng
+        self.words = [
+            "".join(rng.choice(letters) for _ in range(rng.randint(2, 10))) for _ in range(vocabulary)
+        ]
+        self.weights = [1 / rank for rank in range(1, vocabulary + 1)]
+
+    def word(self) -> str:
+        return self.rng.choices(self.words, self.weights)[0]
+
+    def sentence(self, min_words: int = 5, max_words: int = 12) -> str:
+        count = self.rng.randint(min_words, max_words)
+        return " ".join(self.rng.choices(self.words, self.weights, k=count)).capitalize() + "."
+
+
+def payloads(seed: int) -> dict:
+    """
+    API yanıtlarına benzeyen JSON gövdeleri: kelime listesi, ilerleme listesi, kelime paketi
+    """
+    rng = random.Random(seed)
+    text = _Text(rng)
+
+    def word(word_id: int) -> dict:
+        return {
+            "id": word_id,
+            "text": text.words[word_id % len(text.words)],
+            "translation": text.word(),
+            "pronunciation": text.words[word_id % len(text.words)],
+            "example_sentence": text.sentence(),
+            "language_id": 1,
+            "level_id": rng.randint(1, 6),
+        }
+
+    progress = [
+        {
+            "language_id": 1, "level_id": level, "total_words": rng.randint(100, 900),
+            "correct_answers": rng.randint(0, 500), "total_attempts": rng.randint(0, 900),
+            "success_rate": round(rng.random() * 100, 2), "is_completed": False, "is_unlocked": True,
+            "started_at": "2026-01-01T10:00:00", "completed_at": None, "last_activity": "2026-02-01T10:00:00",
+        }
+        for level in range(1, 7)
+    ]
+    pack_words = [
+        [word_id, text.words[word_id % len(text.words)], text.word(), None, text.sentence()]
+        for word_id in range(1, 5001)
+    ]
+    return {
+        "search (20 words)": json.dumps([word(i) for i in range(20)]).encode(),
+        "list (100 words)": json.dumps([word(i) for i in range(100)]).encode(),
+        "progress (6 levels)": json.dumps({"changes": progress, "cursor": "cDoxMjM", "has_more": False}).encode(),
+        "vocab pack (5000 words)": json.dumps({"words": pack_words}, separators=(",", ":")).encode(),
+    }
+
+
+def compressor(encoding: str, level: int):
+    if encoding == "br":
+        return lambda data: brotli.compress(data, quality=level)
+    if encoding == "zstd":
+        zstd = zstandard.ZstdCompressor(level=level)
+        return zstd.compress
+    return lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def measure(compress, data: bytes, min_seconds: float) -> tuple:
+    runs = 0
+    started = time.process_time()
+    while True:
+        compressed = compress(data)
+        runs += 1
+        elapsed = time.process_time() - started
+        if elapsed >= min_seconds:
+            return elapsed / runs, len(compressed)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="Ölçüm başına en az CPU süresi")
+    args = parser.parse_args()
+
+    available = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    for name, data in payloads(args.seed).items():
+        print(f"\n{name}: {len(data):,} bytes")
+        print(f"  {'encoding':8} {'level':>5} {'ratio':>7} {'bytes':>9} {'us/call':>10} {'MB/s':>8}")
+        for encoding, levels in LEVELS.items():
+            if not available[encoding]:
+                print(f"  {encoding:8} (not installed)")
+                continue
+            for level in levels:
+                seconds, size = measure(compressor(encoding, level), data, args.min_seconds)
+                print(
+                    f"  {encoding:8} {level:>5} {len(data) / size:>7.2f} {size:>9,} "
+                    f"{seconds * 1e6:>10.1f} {len(data) / seconds / 2**20:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
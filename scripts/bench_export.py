@@ -0,0 +1,112 @@
+"""
+Kullanıcı export'u benchmark'ı: büyük bir sentetik kullanıcı için iter_user_export'un
+byte/saniye hızı ve bellek kullanımı.
+
+Ayarlardaki veritabanına geçici bir dil, seviye, kelimeler ve kullanıcı ekler; ölçümden sonra siler.
+Üretim veritabanında çalıştırmayın.
+
+Kullanım:
+    cd app && python ../scripts/bench_export.py --attempts 2000000
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from sqlalchemy import text  # noqa: E402
+from core.export import iter_user_export  # noqa: E402
+from db.session import engine  # noqa: E402
+
+SEED_SQL = """
+WITH language AS (
+    INSERT INTO languages (code, name) VALUES (:code, 'Bench') RETURNING id
+), level AS (
+    INSERT INTO language_levels (code, name, "order") VALUES (:code, 'Bench', 99) RETURNING id
+), usr AS (
+    INSERT INTO users (email, name, is_active) VALUES (:email, 'Bench', true) RETURNING id
+)
+SELECT (SELECT id FROM language), (SELECT id FROM level), (SELECT id FROM usr)
+"""
+
+WORDS_SQL = """
+INSERT INTO words (text, translation, language_id, level_id)
+SELECT 'word' || n, 'kelime' || n, :language_id, :level_id FROM generate_series(1, :count) AS n
+"""
+
+ATTEMPTS_SQL = """
+INSERT INTO word_attempts (user_id, word_id, user_answer, is_correct, response_time, attempted_at, client_id)
+SELECT :user_id, w.first_id + n % :words, 'cevap ' || n, n % 3 <> 0, 500 + n % 7000,
+       now() - n * interval '1 second', md5(n::text)
+FROM generate_series(1, :count) AS n,
+     (SELECT min(id) AS first_id FROM words WHERE language_id = :language_id) AS w
+"""
+
+CLEANUP_SQL = (
+    "DELETE FROM user_progress WHERE user_id = :user_id",
+    "DELETE FROM users WHERE id = :user_id",
+    "DELETE FROM words WHERE language_id = :language_id",
+    "DELETE FROM languages WHERE id = :language_id",
+    "DELETE FROM language_levels WHERE id = :level_id",
+)
+
+
+def seed(attempts: int, words: int) -> dict:
+    code = uuid.uuid4().hex[:2].upper()
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        language_id, level_id, user_id = connection.execute(
+            text(SEED_SQL), {"code": code, "email": f"bench-{uuid.uuid4().hex}@example.com"}
+        ).one()
+        ids = {"language_id": language_id, "level_id": level_id, "user_id": user_id}
+        connection.execute(text(WORDS_SQL), {**ids, "count": words})
+        connection.execute(text(ATTEMPTS_SQL), {**ids, "count": attempts, "words": words})
+    print(f"seeded {attempts:,} attempts in {time.perf_counter() - started:.1f}s")
+    return ids
+
+
+def cleanup(ids: dict) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM word_attempts WHERE user_id = :user_id"), ids)
+    # Kelimeleri silerken FK kontrolü word_attempts'i tarar; ölü satırları önce temizle
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM word_attempts"))
+    with engine.begin() as connection:
+        for statement in CLEANUP_SQL:
+            connection.execute(text(statement), ids)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attempts", type=int, default=2_000_000)
+    parser.add_argument("--words", type=int, default=1_000)
+    parser.add_argument("--keep", action="store_true", help="Sentetik veriyi silme")
+    args = parser.parse_args()
+
+    ids = seed(args.attempts, args.words)
+    try:
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        total = 0
+        chunks = 0
+        largest = 0
+        started = time.perf_counter()
+        for chunk in iter_user_export(ids["user_id"]):
+            total += len(chunk)
+            chunks += 1
+            largest = max(largest, len(chunk))
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        print(f"archive: {total / 2**20:.1f} MiB in {chunks:,} chunks (largest {largest / 2**10:.0f} KiB)")
+        print(f"elapsed: {elapsed:.2f}s  ->  {total / elapsed / 2**20:.1f} MiB/s, {args.attempts / elapsed:,.0f} attempts/s")
+        print(f"max RSS: {rss_before / 2**10:.1f} MiB before, {rss_after / 2**10:.1f} MiB after export")
+    finally:
+        if not args.keep:
+            cleanup(ids)
+
+
+if __name__ == "__main__":
+    main()
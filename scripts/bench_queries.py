@@ -0,0 +1,115 @@
+"""
+Sık çalışan kullanıcı/dil sorgularının Python tarafı maliyeti: legacy Query, modül seviyesinde
+kurulmuş select() ve lambda_stmt karşılaştırması.
+
+Her çağrının toplam süresinden cursor.execute içinde (veritabanında) geçen süre çıkarılarak
+SQLAlchemy'nin sorguyu kurma, cache'te bulma ve sonucu ORM nesnelerine çevirme maliyeti ölçülür.
+Ayarlardaki veritabanına geçici bir kullanıcı ekler ve sonra siler.
+
+Kullanım:
+    cd app && python ../scripts/bench_queries.py --calls 20000
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from sqlalchemy import bindparam, event, lambda_stmt, select, text  # noqa: E402
+from db.models.language import Language  # noqa: E402
+from db.models.user import User  # noqa: E402
+from db.session import SessionLocal, engine  # noqa: E402
+
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+LANGUAGE_LIST = select(Language)
+
+
+class DatabaseTimer:
+    """
+    cursor.execute içinde geçen süreyi toplar
+    """
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.statements = 0
+        self._started = None
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, *args):
+        self._started = time.perf_counter()
+
+    def _after(self, *args):
+        self.seconds += time.perf_counter() - self._started
+        self.statements += 1
+
+    def reset(self):
+        self.seconds = 0.0
+        self.statements = 0
+
+
+def variants(user_id: int) -> dict:
+    return {
+        "user by id": {
+            "legacy query": lambda db: db.query(User).filter(User.id == user_id).first(),
+            "module select": lambda db: db.execute(USER_BY_ID, {"user_id": user_id}).scalars().first(),
+            "lambda_stmt": lambda db: db.execute(
+                lambda_stmt(lambda: select(User).where(User.id == user_id))
+            ).scalars().first(),
+        },
+        "language list": {
+            "legacy query": lambda db: db.query(Language).all(),
+            "module select": lambda db: db.execute(LANGUAGE_LIST).scalars().all(),
+            "lambda_stmt": lambda db: db.execute(lambda_stmt(lambda: select(Language))).scalars().all(),
+        },
+    }
+
+
+def measure(call, calls: int, timer: DatabaseTimer) -> tuple:
+    db = SessionLocal()
+    try:
+        for _ in range(200):
+            call(db)
+            db.expunge_all()
+        timer.reset()
+        started = time.perf_counter()
+        for _ in range(calls):
+            call(db)
+            # Her çağrı nesneleri yeniden yüklesin (identity map'ten dönmesin)
+            db.expunge_all()
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+    return elapsed, elapsed - timer.seconds, timer.statements
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            text("INSERT INTO users (email, name, is_active) VALUES (:email, 'Bench', true) RETURNING id"),
+            {"email": f"bench-{uuid.uuid4().hex}@example.com"},
+        ).scalar()
+    timer = DatabaseTimer()
+    try:
+        for name, calls in variants(user_id).items():
+            print(name)
+            for variant, call in calls.items():
+                elapsed, python_seconds, statements = measure(call, args.calls, timer)
+                print(
+                    f"  {variant:14} {statements / elapsed:8,.0f} statements/s   "
+                    f"{elapsed / args.calls * 1e6:6.1f}us per call, "
+                    f"{python_seconds / args.calls * 1e6:6.1f}us of it in Python"
+                )
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text("DELETE FROM users WHERE id = :user_id"), {"user_id": user_id})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Quiz trafiği benchmark'ı: HTTP akışı (GET /word/recommended + cevap başına POST /sync/attempts)
+ile WebSocket oturumunu (/quiz/session) karşılaştırır.
+
+Uygulama süreç içinde TestClient ile çalıştırılır; ağ gecikmesi ölçülmez, cevap başına
+sunucu maliyeti (süre ve veritabanı sorgusu) ölçülür. Ayarlardaki veritabanına geçici
+bir dil, kelimeler ve kullanıcılar ekler; ölçümden sonra siler. Üretim veritabanında çalıştırmayın.
+
+Kullanım:
+    cd app && python ../scripts/bench_quiz.py --users 8 --questions 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from core.security import create_access_token  # noqa: E402
+from db.session import engine  # noqa: E402
+from main import app  # noqa: E402
+
+SEED_SQL = """
+WITH language AS (
+    INSERT INTO languages (code, name) VALUES (:code, 'Bench') RETURNING id
+), level AS (
+    INSERT INTO language_levels (code, name, "order") VALUES (:code, 'Bench', 99) RETURNING id
+)
+SELECT (SELECT id FROM language), (SELECT id FROM level)
+"""
+
+WORDS_SQL = """
+INSERT INTO words (text, translation, language_id, level_id)
+SELECT 'word' || n, 'kelime' || n, :language_id, :level_id FROM generate_series(1, :count) AS n
+"""
+
+USERS_SQL = """
+INSERT INTO users (email, name, is_active, target_language_id)
+SELECT 'bench-' || :tag || '-' || n || '@example.com', 'Bench', true, :language_id
+FROM generate_series(1, :count) AS n
+RETURNING id
+"""
+
+CLEANUP_SQL = (
+    "DELETE FROM word_attempts WHERE user_id = ANY(:user_ids)",
+    "DELETE FROM user_progress WHERE user_id = ANY(:user_ids)",
+    "DELETE FROM user_abilities WHERE user_id = ANY(:user_ids)",
+    "DELETE FROM users WHERE id = ANY(:user_ids)",
+    "DELETE FROM words WHERE language_id = :language_id",
+    "DELETE FROM languages WHERE id = :language_id",
+    "DELETE FROM language_levels WHERE id = :level_id",
+)
+
+
+_statements = [0]
+_statements_lock = threading.Lock()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(*args):
+    with _statements_lock:
+        _statements[0] += 1
+
+
+def statement_count() -> int:
+    with _statements_lock:
+        return _statements[0]
+
+
+def seed(users: int, words: int) -> dict:
+    code = uuid.uuid4().hex[:2].upper()
+    with engine.begin() as connection:
+        language_id, level_id = connection.execute(text(SEED_SQL), {"code": code}).one()
+        connection.execute(text(WORDS_SQL), {"language_id": language_id, "level_id": level_id, "count": words})
+        user_ids = connection.execute(
+            text(USERS_SQL), {"tag": uuid.uuid4().hex[:8], "language_id": language_id, "count": users}
+        ).scalars().all()
+    return {"language_id": language_id, "level_id": level_id, "user_ids": list(user_ids)}
+
+
+def cleanup(ids: dict) -> None:
+    with engine.begin() as connection:
+        for statement in CLEANUP_SQL:
+            connection.execute(text(statement), ids)
+
+
+def http_quiz(client: TestClient, token: str, questions: int) -> list:
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.get("/api/v1/word/recommended", params={"limit": questions}, headers=headers)
+    response.raise_for_status()
+    latencies = []
+    for word in response.json():
+        started = time.perf_counter()
+        response = client.post("/api/v1/sync/attempts", headers=headers, json={"attempts": [{
+            "client_id": uuid.uuid4().hex,
+            "word_id": word["id"],
+            "user_answer": word["translation"],
+            "response_time": 1500,
+            "attempted_at": datetime.now(timezone.utc).isoformat(),
+        }]})
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def websocket_quiz(client: TestClient, token: str, questions: int) -> list:
+    latencies = []
+    with client.websocket_connect(f"/api/v1/quiz/session?token={token}") as websocket:
+        websocket.send_json({"type": "start", "count": questions})
+        message = websocket.receive_json()
+        for question in message["questions"]:
+            started = time.perf_counter()
+            websocket.send_json({"type": "answer", "word_id": question["word_id"], "answer": "x", "response_time": 1500})
+            result = websocket.receive_json()
+            if result["type"] != "result":
+                raise RuntimeError(result)
+            latencies.append(time.perf_counter() - started)
+        websocket.send_json({"type": "finish"})
+        summary = websocket.receive_json()
+        if summary["type"] != "summary":
+            raise RuntimeError(summary)
+    return latencies
+
+
+def run(name: str, quiz, tokens: list, questions: int) -> None:
+    # Uygulamanın açılışı (lifespan) ölçüme girmesin: tüm istemciler hazır olunca başlanır
+    ready = threading.Barrier(len(tokens))
+
+    def user_run(token):
+        with TestClient(app) as client:
+            ready.wait()
+            started = time.perf_counter()
+            latencies = quiz(client, token, questions)
+            return started, time.perf_counter(), latencies
+
+    with ThreadPoolExecutor(max_workers=len(tokens)) as pool:
+        results = list(pool.map(user_run, tokens))
+    elapsed = max(result[1] for result in results) - min(result[0] for result in results)
+
+    latencies = sorted(latency * 1000 for _, _, user_latencies in results for latency in user_latencies)
+    answers = len(latencies)
+    print(
+        f"{name:9} {answers:6,} answers in {elapsed:6.2f}s ({answers / elapsed:7.1f} answers/s)   "
+        f"answer p50 {statistics.median(latencies):6.2f}ms  p99 {latencies[int(answers * 0.99)]:6.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--words", type=int, default=2_000)
+    args = parser.parse_args()
+
+    ids = seed(args.users, args.words)
+    try:
+        tokens = [create_access_token({"sub": str(user_id)}) for user_id in ids["user_ids"]]
+        print(f"{args.users} concurrent users x {args.questions} questions")
+        for name, quiz in (("http", http_quiz), ("websocket", websocket_quiz)):
+            queries_before = statement_count()
+            run(name, quiz, tokens, args.questions)
+            queries = statement_count() - queries_before
+            print(f"{'':9} {queries:6,} database statements ({queries / (args.users * args.questions):.2f} per answer)")
+    finally:
+        cleanup(ids)
+
+
+if __name__ == "__main__":
+    main()